@@ -0,0 +1,99 @@
+# ai_kernels.py - Numeric inner loops for the AI system
+"""
+Free-function kernels for the AI system's hot paths.
+
+Each kernel works on the flat position/type columns of a SpatialCache and
+only touches local variables and plain floats, so the per-candidate work
+avoids attribute lookups on Entity or behavior objects.
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def nearest_of_type(candidates: Iterable[int], xs: List[float], ys: List[float],
+                    type_ids: List[int], wanted_type_ids, x: float, y: float,
+                    radius: float, entities: List, exclude=None) -> int:
+    """Index of the closest candidate of a wanted type within radius, or -1"""
+    best_index = -1
+    best_d2 = radius * radius
+
+    for i in candidates:
+        if type_ids[i] not in wanted_type_ids:
+            continue
+        # Cheap bounding-box reject before the squared distance
+        dx = xs[i] - x
+        if dx > radius or dx < -radius:
+            continue
+        dy = ys[i] - y
+        if dy > radius or dy < -radius:
+            continue
+        d2 = dx * dx + dy * dy
+        if d2 > best_d2 or entities[i] is exclude:
+            continue
+        # Ties go to the earlier entity so results match a linear scan
+        if best_index < 0 or d2 < best_d2 or i < best_index:
+            best_index = i
+            best_d2 = d2
+
+    return best_index
+
+
+def first_within(candidates: Iterable[int], xs: List[float], ys: List[float],
+                 x: float, y: float, radius: float, entities: List, exclude=None) -> int:
+    """Lowest candidate index within radius, or -1"""
+    first_index = -1
+    range_sq = radius * radius
+
+    for i in candidates:
+        if first_index >= 0 and i > first_index:
+            continue
+        # Cheap bounding-box reject before the squared distance
+        dx = xs[i] - x
+        if dx > radius or dx < -radius:
+            continue
+        dy = ys[i] - y
+        if dy > radius or dy < -radius:
+            continue
+        if dx * dx + dy * dy <= range_sq and entities[i] is not exclude:
+            first_index = i
+
+    return first_index
+
+
+def flee_point(x: float, y: float, threat_x: float, threat_y: float,
+               flee_range: float) -> Optional[Tuple[float, float]]:
+    """Point flee_range away from (x, y), directly away from the threat"""
+    flee_x = x - threat_x
+    flee_y = y - threat_y
+    d2 = flee_x * flee_x + flee_y * flee_y
+    if d2 <= 0:
+        return None
+    # One sqrt and a single division, then multiplies
+    scale = flee_range / math.sqrt(d2)
+    return (x + flee_x * scale, y + flee_y * scale)
+
+
+def remember_target(last_seen_targets: Dict[str, Any], last_seen_times: Dict[str, float],
+                    target_id: str, position, current_time: float, capacity: int) -> None:
+    """Record a sighting, forgetting the least recently seen target when memory is full"""
+    if last_seen_times.pop(target_id, None) is not None:
+        # Re-sighted: reinsert below so it moves to the end of the order
+        last_seen_targets.pop(target_id, None)
+    elif len(last_seen_times) >= capacity:
+        # Dicts keep insertion order and every sighting is (re)inserted at
+        # the end, so the first key is the least recently seen target
+        oldest_id = next(iter(last_seen_times))
+        del last_seen_times[oldest_id]
+        last_seen_targets.pop(oldest_id, None)
+    last_seen_targets[target_id] = position
+    last_seen_times[target_id] = current_time
+
+
+def recall_target(last_seen_times: Dict[str, float], current_time: float,
+                  memory_duration: float) -> Optional[str]:
+    """First remembered target seen within memory_duration, or None"""
+    for target_id, last_seen_time in last_seen_times.items():
+        if current_time - last_seen_time < memory_duration:
+            return target_id
+    return None
@@ -5,14 +5,223 @@ configurable through JSON files.
 """
 
 import json
-import math
+import os
 import random
 from typing import Dict, List, Tuple, Optional, Any, Callable
 from dataclasses import dataclass, field
 from entities.entity import Entity
+from ai_kernels import nearest_of_type, first_within, flee_point, remember_target, recall_target
 
 
-@dataclass
+# Entity type name -> small integer id, shared by all AI systems
+_type_ids: Dict[str, int] = {}
+
+
+def intern_type(entity_type: str) -> int:
+    """Map an entity type name to a stable integer id"""
+    type_id = _type_ids.get(entity_type)
+    if type_id is None:
+        type_id = _type_ids[entity_type] = len(_type_ids)
+    return type_id
+
+
+# Config path -> ((mtime_ns, size), parsed JSON) from the last load
+_parsed_configs: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _read_json_config(config_path: str) -> Dict[str, Any]:
+    """Parse a JSON config file, reusing the previous parse while the file is unchanged"""
+    stat = os.stat(config_path)
+    file_key = (stat.st_mtime_ns, stat.st_size)
+    cached = _parsed_configs.get(config_path)
+    if cached is not None and cached[0] == file_key:
+        return cached[1]
+    
+    with open(config_path, 'r') as f:
+        config = json.load(f)
+    _parsed_configs[config_path] = (file_key, config)
+    return config
+
+
+def _spread_bits(n: int) -> int:
+    """Spread the low 16 bits of n so a zero bit sits between each pair"""
+    n &= 0x0000FFFF
+    n = (n | (n << 8)) & 0x00FF00FF
+    n = (n | (n << 4)) & 0x0F0F0F0F
+    n = (n | (n << 2)) & 0x33333333
+    n = (n | (n << 1)) & 0x55555555
+    return n
+
+
+def morton_code(ix: int, iy: int) -> int:
+    """Interleave two cell coordinates into a Z-order (Morton) code"""
+    return _spread_bits(ix) | (_spread_bits(iy) << 1)
+
+
+class SpatialCache:
+    """
+    Per-tick snapshot of entity positions and types.
+    
+    Stores positions and type ids as parallel columns (structure of arrays)
+    so behaviors can scan candidates without touching the Entity objects.
+    Range queries go through a uniform grid built on first use, so each
+    query only visits the cells overlapping its radius. Typed queries use
+    a per-type-set index and grid shared by every AI asking for the same
+    types this tick, so they never visit entities of other types.
+    Iterating the cache yields the snapshotted entities, so it can be passed
+    anywhere a list of entities is expected.
+    """
+    
+    # Below this many entities a straight scan is cheaper than the grid
+    GRID_MIN_ENTITIES = 64
+    
+    def __init__(self, entities: List[Entity], cell_size: float = 100.0):
+        self.entities: List[Entity] = []
+        self.xs: List[float] = []
+        self.ys: List[float] = []
+        self.type_ids: List[int] = []
+        self.unpositioned: List[Entity] = []
+        self.cell_size = cell_size
+        self._grid: Optional[Dict[Tuple[int, int], List[int]]] = None
+        self._typed: Dict[frozenset, Tuple[List[int], Optional[Dict[Tuple[int, int], List[int]]]]] = {}
+        
+        known_type_id = _type_ids.get
+        for entity in entities:
+            position = getattr(entity, 'position', None)
+            if position is None:
+                self.unpositioned.append(entity)
+                continue
+            x, y = position
+            entity_type = getattr(entity, 'type', 'unknown')
+            type_id = known_type_id(entity_type)
+            if type_id is None:
+                type_id = intern_type(entity_type)
+            self.entities.append(entity)
+            self.xs.append(x)
+            self.ys.append(y)
+            self.type_ids.append(type_id)
+    
+    @classmethod
+    def of(cls, entities: List[Entity]) -> 'SpatialCache':
+        """Return entities as a cache, building one if needed"""
+        if isinstance(entities, cls):
+            return entities
+        return cls(entities)
+    
+    def __iter__(self):
+        return iter(self.entities)
+    
+    def __len__(self) -> int:
+        return len(self.entities)
+    
+    def morton_order(self) -> List[int]:
+        """Entity indices sorted so that spatially close entities are adjacent"""
+        xs = self.xs
+        ys = self.ys
+        if not xs:
+            return []
+        
+        cell_size = self.cell_size
+        min_x = min(xs)
+        min_y = min(ys)
+        codes = [morton_code(int((x - min_x) // cell_size), int((ys[i] - min_y) // cell_size))
+                 for i, x in enumerate(xs)]
+        return sorted(range(len(codes)), key=codes.__getitem__)
+    
+    def same_entities(self, other: Optional['SpatialCache']) -> bool:
+        """True if other snapshotted the same entity objects in the same order"""
+        # List equality compares the (identity-equal) entities in C
+        return (other is not None and self.entities == other.entities
+                and self.unpositioned == other.unpositioned)
+    
+    def all_entities(self) -> List[Entity]:
+        """Positioned entities followed by unpositioned ones"""
+        return self.entities + self.unpositioned
+    
+    def iteration_order(self) -> List[int]:
+        """Indices into all_entities(): Morton order, unpositioned ones last"""
+        return self.morton_order() + list(range(len(self.entities), len(self.entities) + len(self.unpositioned)))
+    
+    def _build_grid(self, indices=None) -> Dict[Tuple[int, int], List[int]]:
+        """Bucket entity indices (all of them by default) by grid cell"""
+        grid: Dict[Tuple[int, int], List[int]] = {}
+        cell_size = self.cell_size
+        xs = self.xs
+        ys = self.ys
+        
+        for i in (range(len(xs)) if indices is None else indices):
+            key = (int(xs[i] // cell_size), int(ys[i] // cell_size))
+            bucket = grid.get(key)
+            if bucket is None:
+                grid[key] = [i]
+            else:
+                bucket.append(i)
+        
+        if indices is None:
+            self._grid = grid
+        return grid
+    
+    def _cells_overlapping(self, grid, count: int, x: float, y: float, radius: float):
+        """Indices in the grid cells overlapping the radius, or None if a scan is cheaper"""
+        cell_size = self.cell_size
+        min_cx = int((x - radius) // cell_size)
+        max_cx = int((x + radius) // cell_size)
+        min_cy = int((y - radius) // cell_size)
+        max_cy = int((y + radius) // cell_size)
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) >= count:
+            # Radius covers more cells than there are entities
+            return None
+        
+        if grid is None:
+            grid = self._build_grid()
+        result: List[int] = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = grid.get((cx, cy))
+                if bucket:
+                    result.extend(bucket)
+        return result
+    
+    def candidates(self, x: float, y: float, radius: float):
+        """Indices of entities that may lie within radius of (x, y)"""
+        count = len(self.entities)
+        if count < self.GRID_MIN_ENTITIES:
+            return range(count)
+        
+        result = self._cells_overlapping(self._grid, count, x, y, radius)
+        return range(count) if result is None else result
+    
+    def typed_candidates(self, x: float, y: float, radius: float, wanted_type_ids: frozenset):
+        """Indices of entities of the wanted types that may lie within radius of (x, y)"""
+        typed = self._typed.get(wanted_type_ids)
+        if typed is None:
+            type_ids = self.type_ids
+            indices = [i for i in range(len(type_ids)) if type_ids[i] in wanted_type_ids]
+            grid = self._build_grid(indices) if len(indices) >= self.GRID_MIN_ENTITIES else None
+            typed = self._typed[wanted_type_ids] = (indices, grid)
+        
+        indices, grid = typed
+        if grid is None:
+            return indices
+        
+        result = self._cells_overlapping(grid, len(indices), x, y, radius)
+        return indices if result is None else result
+    
+    def nearest(self, x: float, y: float, radius: float, wanted_type_ids,
+                exclude: Optional[Entity] = None) -> int:
+        """Index of the closest entity of a wanted type within radius, or -1"""
+        return nearest_of_type(self.typed_candidates(x, y, radius, wanted_type_ids), self.xs, self.ys,
+                               self.type_ids, wanted_type_ids, x, y, radius,
+                               self.entities, exclude)
+    
+    def first_within(self, x: float, y: float, radius: float,
+                     exclude: Optional[Entity] = None) -> int:
+        """Index of the first entity (in snapshot order) within radius, or -1"""
+        return first_within(self.candidates(x, y, radius), self.xs, self.ys,
+                            x, y, radius, self.entities, exclude)
+
+
+@dataclass(slots=True)
 class AIMemory:
     """Memory storage for AI entities"""
     last_seen_targets: Dict[str, Tuple[float, float]] = field(default_factory=dict)
@@ -23,7 +232,7 @@ class AIMemory:
     blackboard: Dict[str, Any] = field(default_factory=dict)  # General purpose data storage
 
 
-@dataclass
+@dataclass(slots=True)
 class AIState:
     """Current state of an AI entity"""
     behavior_name: str = "idle"
@@ -34,72 +243,98 @@ class AIState:
 
 
 class AIBehavior:
-    """Base class for AI behaviors"""
+    """
+    Base class for AI behaviors.
+    
+    Subclasses read their settings out of the config dict once in __init__
+    and keep them as slotted attributes; the dict itself is not retained.
+    """
+    
+    __slots__ = ('name', 'enabled', 'priority', 'energy_rate', 'alertness_rate')
     
     def __init__(self, config: Dict[str, Any]):
-        self.config = config
         self.name = config.get('name', 'unknown')
         self.enabled = config.get('enabled', True)
         self.priority = config.get('priority', 0)
         
+        # Energy/alertness change per second while this behavior is active.
+        # AISystem applies these for all entities in one pass after dispatch.
+        self.energy_rate = 0.0
+        self.alertness_rate = 0.0
+        
     def can_execute(self, entity: Entity, ai_state: AIState, entities: List[Entity]) -> bool:
         """Check if this behavior can be executed"""
         if not self.enabled:
             return False
         return self._can_execute(entity, ai_state, entities)
     
-    def execute(self, entity: Entity, ai_state: AIState, entities: List[Entity], dt: float) -> None:
-        """Execute the behavior"""
+    def execute(self, entity: Entity, ai_state: AIState, entities: List[Entity], dt: float) -> bool:
+        """
+        Execute the behavior.
+        
+        Returns whether the behavior did its work this tick; only then does
+        AISystem apply its energy and alertness rates.
+        """
         if not self.enabled:
-            return
+            return False
         ai_state.state_time += dt
-        self._execute(entity, ai_state, entities, dt)
+        # Overrides that don't return anything count as having done their work
+        return self._execute(entity, ai_state, entities, dt) is not False
     
     def _can_execute(self, entity: Entity, ai_state: AIState, entities: List[Entity]) -> bool:
         """Override this method in subclasses"""
         return True
     
-    def _execute(self, entity: Entity, ai_state: AIState, entities: List[Entity], dt: float) -> None:
-        """Override this method in subclasses"""
-        pass
+    def _execute(self, entity: Entity, ai_state: AIState, entities: List[Entity], dt: float) -> bool:
+        """Override this method in subclasses; return False if nothing was done"""
+        return True
 
 
 class IdleBehavior(AIBehavior):
     """Default idle behavior"""
     
-    def _execute(self, entity: Entity, ai_state: AIState, entities: List[Entity], dt: float) -> None:
-        # Gradually reduce alertness
-        ai_state.alertness = max(0, ai_state.alertness - 0.1 * dt)
-        
-        # Recover energy
-        recovery_rate = self.config.get('energy_recovery_rate', 10.0)
-        ai_state.energy = min(100.0, ai_state.energy + recovery_rate * dt)
+    __slots__ = ()
+    
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        # Gradually reduce alertness and recover energy
+        self.energy_rate = float(config.get('energy_recovery_rate', 10.0))
+        self.alertness_rate = -0.1
 
 
 class PatrolBehavior(AIBehavior):
     """Patrol behavior - move between waypoints"""
     
+    __slots__ = ('waypoints', 'arrival_tolerance_sq')
+    
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.waypoints = [tuple(wp) for wp in config.get('waypoints', [])]
+        self.arrival_tolerance_sq = float(config.get('arrival_tolerance', 10.0)) ** 2
+        self.energy_rate = -float(config.get('energy_cost', 2.0))
+    
     def _can_execute(self, entity: Entity, ai_state: AIState, entities: List[Entity]) -> bool:
         return ai_state.energy > 20.0  # Need energy to patrol
     
-    def _execute(self, entity: Entity, ai_state: AIState, entities: List[Entity], dt: float) -> None:
-        waypoints = self.config.get('waypoints', [])
+    def _execute(self, entity: Entity, ai_state: AIState, entities: List[Entity], dt: float) -> bool:
+        waypoints = self.waypoints
         if not waypoints:
-            return
+            return False
             
         # Get current waypoint index from goal data
         current_wp = ai_state.memory.goal_data.get('current_waypoint', 0)
         target_pos = waypoints[current_wp]
         
-        if hasattr(entity, 'position'):
-            x, y = entity.position
+        position = getattr(entity, 'position', None)
+        if position is not None:
+            x, y = position
             target_x, target_y = target_pos
             
-            # Calculate distance to target
-            distance = math.sqrt((target_x - x)**2 + (target_y - y)**2)
-            tolerance = self.config.get('arrival_tolerance', 10.0)
+            # Compare squared distance to target against squared tolerance
+            dx = target_x - x
+            dy = target_y - y
             
-            if distance < tolerance:
+            if dx * dx + dy * dy < self.arrival_tolerance_sq:
                 # Move to next waypoint
                 ai_state.memory.goal_data['current_waypoint'] = (current_wp + 1) % len(waypoints)
             
@@ -107,197 +342,173 @@ class PatrolBehavior(AIBehavior):
             ai_state.memory.current_target = None  # Clear entity target
             ai_state.memory.goal_data['target_position'] = target_pos
         
-        # Consume energy
-        energy_cost = self.config.get('energy_cost', 2.0)
-        ai_state.energy = max(0, ai_state.energy - energy_cost * dt)
+        return True
 
 
 class HuntBehavior(AIBehavior):
     """Hunt behavior - search for and pursue targets"""
     
+    __slots__ = ('detection_range', 'target_type_ids', 'memory_duration')
+    
+    # Sightings kept per AI; the least recently seen target is forgotten first
+    MAX_REMEMBERED_TARGETS = 16
+    
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.detection_range = float(config.get('detection_range', 100.0))
+        self.target_type_ids = frozenset(
+            intern_type(t) for t in config.get('target_types', ['cargo_ship', 'mining_ship']))
+        self.memory_duration = float(config.get('memory_duration', 10.0))
+        self.energy_rate = -float(config.get('energy_cost', 5.0))
+    
     def _can_execute(self, entity: Entity, ai_state: AIState, entities: List[Entity]) -> bool:
         return ai_state.energy > 30.0  # Need energy to hunt
     
-    def _execute(self, entity: Entity, ai_state: AIState, entities: List[Entity], dt: float) -> None:
-        detection_range = self.config.get('detection_range', 100.0)
-        target_types = self.config.get('target_types', ['cargo_ship', 'mining_ship'])
-        
-        if not hasattr(entity, 'position'):
-            return
+    def _execute(self, entity: Entity, ai_state: AIState, entities: List[Entity], dt: float) -> bool:
+        position = getattr(entity, 'position', None)
+        if position is None:
+            return False
             
-        x, y = entity.position
+        x, y = position
         current_time = ai_state.state_time
         
-        # Search for targets
-        closest_target = None
-        closest_distance = float('inf')
-        
-        for target in entities:
-            if target == entity or not hasattr(target, 'position'):
-                continue
-                
-            # Check if target is of correct type
-            target_type = getattr(target, 'type', 'unknown')
-            if target_type not in target_types:
-                continue
-                
-            # Calculate distance
-            tx, ty = target.position
-            distance = math.sqrt((tx - x)**2 + (ty - y)**2)
-            
-            if distance <= detection_range and distance < closest_distance:
-                closest_target = target
-                closest_distance = distance
+        # Search for the closest target of a wanted type
+        spatial = SpatialCache.of(entities)
+        index = spatial.nearest(x, y, self.detection_range, self.target_type_ids, exclude=entity)
+        memory = ai_state.memory
         
         # Update memory with target
-        if closest_target:
-            target_id = getattr(closest_target, 'id', 'unknown')
-            ai_state.memory.last_seen_targets[target_id] = closest_target.position
-            ai_state.memory.last_seen_times[target_id] = current_time
-            ai_state.memory.current_target = target_id
-            ai_state.memory.goal_data['target_position'] = closest_target.position
+        if index >= 0:
+            target = spatial.entities[index]
+            target_id = getattr(target, 'id', 'unknown')
+            target_position = target.position
+            remember_target(memory.last_seen_targets, memory.last_seen_times, target_id,
+                            target_position, current_time, self.MAX_REMEMBERED_TARGETS)
+            memory.current_target = target_id
+            memory.goal_data['target_position'] = target_position
             ai_state.alertness = min(100.0, ai_state.alertness + 50.0 * dt)
         else:
             # No target found, reduce alertness
             ai_state.alertness = max(0, ai_state.alertness - 10.0 * dt)
             
-            # Check memory for recent targets
-            memory_duration = self.config.get('memory_duration', 10.0)
-            for target_id, last_seen_time in ai_state.memory.last_seen_times.items():
-                if current_time - last_seen_time < memory_duration:
-                    # Move to last known position
-                    ai_state.memory.current_target = target_id
-                    ai_state.memory.goal_data['target_position'] = ai_state.memory.last_seen_targets[target_id]
-                    break
+            # Move to the last known position of a recent target
+            target_id = recall_target(memory.last_seen_times, current_time, self.memory_duration)
+            if target_id is not None:
+                memory.current_target = target_id
+                memory.goal_data['target_position'] = memory.last_seen_targets[target_id]
         
-        # Consume energy
-        energy_cost = self.config.get('energy_cost', 5.0)
-        ai_state.energy = max(0, ai_state.energy - energy_cost * dt)
+        return True
 
 
 class FleeBehavior(AIBehavior):
     """Flee behavior - escape from threats"""
     
+    __slots__ = ('detection_range', 'threat_type_ids', 'flee_range')
+    
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.detection_range = float(config.get('detection_range', 80.0))
+        self.threat_type_ids = frozenset(
+            intern_type(t) for t in config.get('threat_types', ['fighter']))
+        self.flee_range = float(config.get('flee_range', 200.0))
+        self.energy_rate = -float(config.get('energy_cost', 8.0))
+    
     def _can_execute(self, entity: Entity, ai_state: AIState, entities: List[Entity]) -> bool:
         # Flee when energy is low or alertness is high
         return ai_state.energy < 30.0 or ai_state.alertness > 70.0
     
-    def _execute(self, entity: Entity, ai_state: AIState, entities: List[Entity], dt: float) -> None:
-        detection_range = self.config.get('detection_range', 80.0)
-        threat_types = self.config.get('threat_types', ['fighter'])
-        
-        if not hasattr(entity, 'position'):
-            return
+    def _execute(self, entity: Entity, ai_state: AIState, entities: List[Entity], dt: float) -> bool:
+        position = getattr(entity, 'position', None)
+        if position is None:
+            return False
             
-        x, y = entity.position
+        x, y = position
         
         # Find nearest threat
-        nearest_threat = None
-        nearest_distance = float('inf')
-        
-        for threat in entities:
-            if threat == entity or not hasattr(threat, 'position'):
-                continue
-                
-            # Check if entity is a threat
-            threat_type = getattr(threat, 'type', 'unknown')
-            if threat_type not in threat_types:
-                continue
-                
-            # Calculate distance
-            tx, ty = threat.position
-            distance = math.sqrt((tx - x)**2 + (ty - y)**2)
-            
-            if distance <= detection_range and distance < nearest_distance:
-                nearest_threat = threat
-                nearest_distance = distance
+        spatial = SpatialCache.of(entities)
+        index = spatial.nearest(x, y, self.detection_range, self.threat_type_ids, exclude=entity)
         
         # Flee from threat
-        if nearest_threat:
-            tx, ty = nearest_threat.position
-            
-            # Calculate flee direction (opposite of threat)
-            flee_x = x - tx
-            flee_y = y - ty
-            
-            # Normalize and scale
-            flee_distance = math.sqrt(flee_x**2 + flee_y**2)
-            if flee_distance > 0:
-                flee_range = self.config.get('flee_range', 200.0)
-                flee_x = x + (flee_x / flee_distance) * flee_range
-                flee_y = y + (flee_y / flee_distance) * flee_range
-                
-                ai_state.memory.goal_data['target_position'] = (flee_x, flee_y)
+        if index >= 0:
+            # Head directly away from the threat
+            flee_target = flee_point(x, y, spatial.xs[index], spatial.ys[index], self.flee_range)
+            if flee_target:
+                ai_state.memory.goal_data['target_position'] = flee_target
                 ai_state.alertness = min(100.0, ai_state.alertness + 30.0 * dt)
         
-        # Consume energy
-        energy_cost = self.config.get('energy_cost', 8.0)
-        ai_state.energy = max(0, ai_state.energy - energy_cost * dt)
+        return True
 
 
 class GuardBehavior(AIBehavior):
     """Guard behavior - protect an area or entity"""
     
+    __slots__ = ('guard_position', 'guard_radius_sq', 'alert_range')
+    
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.guard_position = tuple(config.get('guard_position', (0.0, 0.0)))
+        self.guard_radius_sq = float(config.get('guard_radius', 100.0)) ** 2
+        self.alert_range = float(config.get('alert_range', 150.0))
+        self.energy_rate = -float(config.get('energy_cost', 3.0))
+    
     def _can_execute(self, entity: Entity, ai_state: AIState, entities: List[Entity]) -> bool:
         return ai_state.energy > 40.0  # Need energy to guard
     
-    def _execute(self, entity: Entity, ai_state: AIState, entities: List[Entity], dt: float) -> None:
-        guard_position = self.config.get('guard_position', (0.0, 0.0))
-        guard_radius = self.config.get('guard_radius', 100.0)
-        alert_range = self.config.get('alert_range', 150.0)
-        
-        if not hasattr(entity, 'position'):
-            return
+    def _execute(self, entity: Entity, ai_state: AIState, entities: List[Entity], dt: float) -> bool:
+        position = getattr(entity, 'position', None)
+        if position is None:
+            return False
             
-        x, y = entity.position
-        guard_x, guard_y = guard_position
+        x, y = position
+        guard_x, guard_y = self.guard_position
         
-        # Calculate distance from guard position
-        distance_from_post = math.sqrt((x - guard_x)**2 + (y - guard_y)**2)
+        # Squared distance from guard position
+        post_dx = x - guard_x
+        post_dy = y - guard_y
+        distance_from_post_sq = post_dx * post_dx + post_dy * post_dy
         
         # Look for intruders
-        intruder_found = False
-        for other in entities:
-            if other == entity or not hasattr(other, 'position'):
-                continue
-                
-            ox, oy = other.position
-            distance_to_other = math.sqrt((ox - guard_x)**2 + (oy - guard_y)**2)
+        spatial = SpatialCache.of(entities)
+        index = spatial.first_within(guard_x, guard_y, self.alert_range, exclude=entity)
+        if index >= 0:
+            # Intruder detected
+            ai_state.alertness = min(100.0, ai_state.alertness + 40.0 * dt)
             
-            if distance_to_other <= alert_range:
-                # Intruder detected
-                intruder_found = True
-                ai_state.alertness = min(100.0, ai_state.alertness + 40.0 * dt)
-                
-                # Move to intercept
-                ai_state.memory.goal_data['target_position'] = (ox, oy)
-                break
-        
-        if not intruder_found:
+            # Move to intercept
+            ai_state.memory.goal_data['target_position'] = (spatial.xs[index], spatial.ys[index])
+        else:
             # Return to guard position if too far
-            if distance_from_post > guard_radius:
-                ai_state.memory.goal_data['target_position'] = guard_position
+            if distance_from_post_sq > self.guard_radius_sq:
+                ai_state.memory.goal_data['target_position'] = self.guard_position
             else:
                 # Stay at post
-                ai_state.memory.goal_data['target_position'] = entity.position
+                ai_state.memory.goal_data['target_position'] = position
             
             ai_state.alertness = max(0, ai_state.alertness - 5.0 * dt)
         
-        # Consume energy
-        energy_cost = self.config.get('energy_cost', 3.0)
-        ai_state.energy = max(0, ai_state.energy - energy_cost * dt)
+        return True
 
 
 class TradeBehavior(AIBehavior):
     """Trade behavior - move between trade points"""
     
+    __slots__ = ('trade_routes', 'arrival_tolerance_sq', 'wait_time')
+    
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.trade_routes = [[tuple(point) for point in route]
+                             for route in config.get('trade_routes', [])]
+        self.arrival_tolerance_sq = float(config.get('arrival_tolerance', 15.0)) ** 2
+        self.wait_time = float(config.get('wait_time', 2.0))
+        self.energy_rate = -float(config.get('energy_cost', 1.5))
+    
     def _can_execute(self, entity: Entity, ai_state: AIState, entities: List[Entity]) -> bool:
         return ai_state.energy > 25.0  # Need energy to trade
     
-    def _execute(self, entity: Entity, ai_state: AIState, entities: List[Entity], dt: float) -> None:
-        trade_routes = self.config.get('trade_routes', [])
+    def _execute(self, entity: Entity, ai_state: AIState, entities: List[Entity], dt: float) -> bool:
+        trade_routes = self.trade_routes
         if not trade_routes:
-            return
+            return False
             
         # Get current route progress
         current_route = ai_state.memory.goal_data.get('current_route', 0)
@@ -313,48 +524,73 @@ class TradeBehavior(AIBehavior):
             current_point = 0
             ai_state.memory.goal_data['current_route'] = current_route
             ai_state.memory.goal_data['current_point'] = current_point
-            return
+            return False
         
         target_pos = route[current_point]
         
-        if hasattr(entity, 'position'):
-            x, y = entity.position
+        position = getattr(entity, 'position', None)
+        if position is not None:
+            x, y = position
             target_x, target_y = target_pos
             
-            # Calculate distance to target
-            distance = math.sqrt((target_x - x)**2 + (target_y - y)**2)
-            tolerance = self.config.get('arrival_tolerance', 15.0)
+            # Compare squared distance to target against squared tolerance
+            dx = target_x - x
+            dy = target_y - y
             
-            if distance < tolerance:
+            if dx * dx + dy * dy < self.arrival_tolerance_sq:
                 # Arrived at trade point
                 current_point += 1
                 ai_state.memory.goal_data['current_point'] = current_point
                 
                 # Wait time at trade point
-                wait_time = self.config.get('wait_time', 2.0)
-                ai_state.memory.goal_data['wait_until'] = ai_state.state_time + wait_time
+                ai_state.memory.goal_data['wait_until'] = ai_state.state_time + self.wait_time
             
             # Check if we should wait
             wait_until = ai_state.memory.goal_data.get('wait_until', 0.0)
             if ai_state.state_time < wait_until:
                 # Waiting at trade point
-                ai_state.memory.goal_data['target_position'] = entity.position
+                ai_state.memory.goal_data['target_position'] = position
             else:
                 # Moving to target
                 ai_state.memory.goal_data['target_position'] = target_pos
         
-        # Consume energy
-        energy_cost = self.config.get('energy_cost', 1.5)
-        ai_state.energy = max(0, ai_state.energy - energy_cost * dt)
+        return True
+
+
+# Built-in behaviors whose can_execute depends only on energy and alertness
+_STATE_GATED_BEHAVIORS = (IdleBehavior, PatrolBehavior, HuntBehavior,
+                          FleeBehavior, GuardBehavior, TradeBehavior)
 
 
 class AISystem:
     """System that manages all AI behaviors"""
     
+    # Alertness change per second from the AI component's aggression, applied
+    # on every component sync; matches the original +10 / -5 per sync at the
+    # default 20 TPS, but stays the same per game second at any AI cadence
+    AGGRESSIVE_ALERTNESS_RATE = 200.0
+    TIMID_ALERTNESS_RATE = 100.0
+    
     def __init__(self, config_path: str = None):
         self.behaviors: Dict[str, AIBehavior] = {}
+        self._sorted_behaviors: List[AIBehavior] = []
+        self._sleepable_behaviors: set = set()
+        # Add and remove entries through assign_ai()/assign_ai_to_entity()
+        # and remove_ai(), which keep the aligned view below up to date
         self.entity_ai_states: Dict[str, AIState] = {}
         
+        # AI states aligned with the snapshot order of the last entity list,
+        # so the per-tick loop indexes a list instead of hashing entity ids.
+        # Rebuilt only when the snapshotted entities or the set of AI states
+        # change; _states_version counts changes to the latter.
+        self._aligned_snapshot: Optional[SpatialCache] = None
+        self._aligned_version = -1
+        self._aligned_states: List[Optional[AIState]] = []
+        self._states_version = 0
+        
+        # Per aligned slot: the idle behavior an at-rest AI is sleeping in
+        self._asleep: List[Optional[AIBehavior]] = []
+        
         # Register built-in behaviors
         self.behavior_classes = {
             'idle': IdleBehavior,
@@ -372,8 +608,9 @@ class AISystem:
     def load_config(self, config_path: str):
         """Load AI configuration from JSON file"""
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            # Behaviors copy what they need out of the definitions, so the
+            # cached parse can be shared between loads
+            config = _read_json_config(config_path)
                 
             # Load behavior definitions
             for behavior_def in config.get('behaviors', []):
@@ -382,6 +619,8 @@ class AISystem:
                     behavior_class = self.behavior_classes[behavior_type]
                     behavior = behavior_class(behavior_def)
                     self.behaviors[behavior.name] = behavior
+            
+            self._sort_behaviors()
                     
         except FileNotFoundError:
             print(f"AI config file not found: {config_path}")
@@ -391,11 +630,33 @@ class AISystem:
     def add_behavior(self, name: str, behavior: AIBehavior):
         """Add a custom AI behavior"""
         self.behaviors[name] = behavior
+        self._sort_behaviors()
+    
+    def _sort_behaviors(self):
+        """Order behaviors by descending priority for first-match dispatch"""
+        # sorted() is stable, so equal priorities keep registration order.
+        # Negative priorities never beat the initial -1 threshold, so drop them.
+        self._sorted_behaviors = sorted(
+            (b for b in self.behaviors.values() if b.priority > -1),
+            key=lambda b: b.priority, reverse=True)
+        
+        # An idle AI at full energy and zero alertness can sleep when every
+        # behavior ranked above its idle behavior only gates on energy and
+        # alertness: nothing can change the choice until that state changes.
+        self._sleepable_behaviors = set()
+        gates_on_state_only = True
+        for behavior in self._sorted_behaviors:
+            if (gates_on_state_only and type(behavior) is IdleBehavior
+                    and behavior.energy_rate >= 0 and behavior.alertness_rate <= 0):
+                self._sleepable_behaviors.add(behavior)
+            if type(behavior) not in _STATE_GATED_BEHAVIORS:
+                gates_on_state_only = False
+        self._asleep = [None] * len(self._aligned_states)
     
     def assign_ai(self, entity_id: str, initial_behavior: str = 'idle', create_component: bool = True, **kwargs):
         """Assign AI to an entity"""
         ai_state = AIState(behavior_name=initial_behavior, **kwargs)
-        self.entity_ai_states[entity_id] = ai_state
+        self._set_ai_state(entity_id, ai_state)
         
         # Optionally create AI component if entity exists
         if create_component:
@@ -451,38 +712,86 @@ class AISystem:
                 component_kwargs[key] = value
         
         ai_state = AIState(behavior_name=initial_behavior, **ai_state_kwargs)
-        self.entity_ai_states[entity_id] = ai_state
+        self._set_ai_state(entity_id, ai_state)
         
         # Create AI component
         self._create_ai_component(entity, initial_behavior, **component_kwargs)
     
+    def _set_ai_state(self, entity_id: str, ai_state: AIState):
+        """Store an entity's AI state and invalidate the aligned view"""
+        self.entity_ai_states[entity_id] = ai_state
+        self._states_version += 1
+    
+    def remove_ai(self, entity_id: str):
+        """Remove an entity's AI state, if it has one"""
+        if self.entity_ai_states.pop(entity_id, None) is not None:
+            self._states_version += 1
+    
+    def _aligned_ai_states(self, spatial: SpatialCache) -> List[Optional[AIState]]:
+        """AI state (or None) for each entity in spatial.all_entities() order"""
+        if (self._states_version != self._aligned_version
+                or not spatial.same_entities(self._aligned_snapshot)):
+            get_state = self.entity_ai_states.get
+            self._aligned_states = [get_state(getattr(entity, 'id', None))
+                                    for entity in spatial.all_entities()]
+            self._aligned_version = self._states_version
+            self._asleep = [None] * len(self._aligned_states)
+        self._aligned_snapshot = spatial
+        return self._aligned_states
+    
     def update(self, entities: List[Entity], dt: float):
-        """Update AI for all entities"""
+        """
+        Update AI for all entities.
+        
+        Each entity's step only reads the shared per-tick snapshot and
+        writes its own AI state and component, so entities are independent
+        of each other within a tick. The loop still runs serially: the
+        behaviors are pure Python, and threads would serialize on the GIL.
+        """
         # Auto-assign AI to entities with AI components
         self.auto_assign_ai_from_components(entities)
         
-        for entity in entities:
-            if not hasattr(entity, 'id'):
-                continue
-                
-            entity_id = entity.id
-            if entity_id not in self.entity_ai_states:
+        # Snapshot positions once so behaviors don't rescan entity objects
+        spatial = self._rebuild_spatial_cache(entities)
+        
+        # Behaviors that ran this tick, for the batched energy pass
+        executed: List[Tuple[AIState, AIBehavior]] = []
+        
+        snapshot = spatial.all_entities()
+        ai_states = self._aligned_ai_states(spatial)
+        asleep = self._asleep
+        
+        # Visit neighbours back-to-back; behaviors only read the snapshot
+        # and write their own entity's state, so order doesn't change results
+        for i in spatial.iteration_order():
+            ai_state = ai_states[i]
+            if ai_state is None:
                 continue
                 
-            ai_state = self.entity_ai_states[entity_id]
+            entity = snapshot[i]
+            ai_component = entity.get_component('ai')
+            at_rest = (ai_state.energy >= 100.0 and ai_state.alertness <= 0.0
+                       and self._ai_component_is_quiet(ai_component, ai_state))
             
-            # Sync with AI component if it exists
-            self._sync_with_ai_component(entity, ai_state)
+            # Sleeping AIs would pick the same idle behavior and change
+            # nothing but their state time, so skip dispatch entirely
+            sleeper = asleep[i]
+            if sleeper is not None:
+                if at_rest and ai_state.behavior_name == sleeper.name:
+                    ai_state.state_time += dt
+                    continue
+                asleep[i] = None
             
-            # Find best behavior to execute
-            best_behavior = None
-            best_priority = -1
+            # Pull component edits; memory only changes when a behavior runs,
+            # and the post-execution sync below writes it then
+            self._sync_with_ai_component(entity, ai_state, ai_component, write_memory=False, dt=dt)
             
-            for behavior in self.behaviors.values():
-                if behavior.can_execute(entity, ai_state, entities):
-                    if behavior.priority > best_priority:
-                        best_behavior = behavior
-                        best_priority = behavior.priority
+            # Highest-priority behavior that can run wins
+            best_behavior = None
+            for behavior in self._sorted_behaviors:
+                if behavior.can_execute(entity, ai_state, spatial):
+                    best_behavior = behavior
+                    break
             
             # Execute behavior
             if best_behavior:
@@ -491,10 +800,40 @@ class AISystem:
                     ai_state.behavior_name = best_behavior.name
                     ai_state.state_time = 0.0  # Reset state time
                 
-                best_behavior.execute(entity, ai_state, entities, dt)
+                # Only behaviors that did their work pay their energy rates
+                if best_behavior.execute(entity, ai_state, spatial, dt):
+                    executed.append((ai_state, best_behavior))
+                
+                if at_rest and best_behavior in self._sleepable_behaviors:
+                    asleep[i] = best_behavior
                 
                 # Sync state back to component
-                self._sync_with_ai_component(entity, ai_state)
+                self._sync_with_ai_component(entity, ai_state, ai_component, dt=dt)
+        
+        self._apply_energy_rates(executed, dt)
+    
+    def _ai_component_is_quiet(self, ai_component: Dict[str, Any], ai_state: AIState) -> bool:
+        """True if syncing with this component would leave the AI state unchanged"""
+        if not ai_component:
+            return True
+        return (ai_component.get('aggression_level', 0.5) <= 0.7
+                and 'current_goal' in ai_component
+                and ai_component['current_goal'] == ai_state.memory.current_goal
+                and bool(ai_component.get('memory')))
+    
+    def _apply_energy_rates(self, executed: List[Tuple[AIState, AIBehavior]], dt: float):
+        """Apply each executed behavior's energy/alertness rates, clamped to 0-100"""
+        for ai_state, behavior in executed:
+            energy = ai_state.energy + behavior.energy_rate * dt
+            ai_state.energy = 0.0 if energy < 0.0 else 100.0 if energy > 100.0 else energy
+            
+            if behavior.alertness_rate:
+                alertness = ai_state.alertness + behavior.alertness_rate * dt
+                ai_state.alertness = 0.0 if alertness < 0.0 else 100.0 if alertness > 100.0 else alertness
+    
+    def _rebuild_spatial_cache(self, entities: List[Entity]) -> SpatialCache:
+        """Build the per-tick position/type snapshot used by behaviors"""
+        return SpatialCache(entities)
     
     def get_ai_state(self, entity_id: str) -> Optional[AIState]:
         """Get AI state for an entity"""
@@ -591,25 +930,46 @@ class AISystem:
         except Exception as e:
             print(f"Error creating AI config: {e}")
     
-    def _sync_with_ai_component(self, entity: Entity, ai_state: AIState):
-        """Sync AI state with entity's AI component if it exists"""
-        ai_component = entity.get_component('ai')
+    def _sync_with_ai_component(self, entity: Entity, ai_state: AIState,
+                                ai_component: Optional[Dict[str, Any]] = None,
+                                write_memory: bool = True, dt: float = 0.05):
+        """
+        Sync AI state with entity's AI component if it exists.
+        
+        Pass ai_component to reuse a lookup already made this tick. With
+        write_memory=False the memory containers are only copied when the
+        component doesn't have them yet; the scalar fields are always kept
+        current. dt is the game time the sync covers (one 20 TPS tick by
+        default) and scales the aggression-driven alertness change.
+        """
+        if ai_component is None:
+            ai_component = entity.get_component('ai')
         if ai_component:
-            # Update AI state from component
-            ai_state.memory.current_goal = ai_component.get('current_goal', ai_state.memory.current_goal)
-            
-            # Update component memory from AI state
-            ai_component['memory'] = {
-                'last_seen_targets': dict(ai_state.memory.last_seen_targets),
-                'last_seen_times': dict(ai_state.memory.last_seen_times),
-                'current_target': ai_state.memory.current_target,
-                'current_goal': ai_state.memory.current_goal,
-                'goal_data': dict(ai_state.memory.goal_data),
-                'blackboard': dict(ai_state.memory.blackboard)
-            }
+            # Pull the goal from the component, or publish ours if it has none
+            if 'current_goal' in ai_component:
+                ai_state.memory.current_goal = ai_component['current_goal']
+            else:
+                ai_component['current_goal'] = ai_state.memory.current_goal
             
-            # Update component state
-            ai_component['current_goal'] = ai_state.memory.current_goal
+            # Expose a copy of AI memory on the component. The containers
+            # are copied so that saving the map (possibly from another
+            # thread) never iterates dicts the game thread is mutating.
+            memory = ai_state.memory
+            component_memory = ai_component.get('memory')
+            if write_memory or not component_memory:
+                ai_component['memory'] = {
+                    'last_seen_targets': dict(memory.last_seen_targets),
+                    'last_seen_times': dict(memory.last_seen_times),
+                    'current_target': memory.current_target,
+                    'current_goal': memory.current_goal,
+                    'goal_data': dict(memory.goal_data),
+                    'blackboard': dict(memory.blackboard)
+                }
+            else:
+                # The containers only change when a behavior runs, but the
+                # goal can be pulled from the component above at any time
+                component_memory['current_target'] = memory.current_target
+                component_memory['current_goal'] = memory.current_goal
             
             # Use component aggression and intelligence for behavior modification
             aggression = ai_component.get('aggression_level', 0.5)
@@ -617,9 +977,9 @@ class AISystem:
             
             # Modify AI behavior based on component properties
             if aggression > 0.7:
-                ai_state.alertness = min(100.0, ai_state.alertness + 10.0)
+                ai_state.alertness = min(100.0, ai_state.alertness + self.AGGRESSIVE_ALERTNESS_RATE * dt)
             elif aggression < 0.3:
-                ai_state.alertness = max(0.0, ai_state.alertness - 5.0)
+                ai_state.alertness = max(0.0, ai_state.alertness - self.TIMID_ALERTNESS_RATE * dt)
     
     def _load_ai_from_component(self, entity: Entity) -> Optional[AIState]:
         """Load AI state from entity's AI component"""
@@ -633,12 +993,14 @@ class AISystem:
         # Load memory from component
         memory_data = ai_component.get('memory', {})
         if memory_data:
-            ai_state.memory.last_seen_targets = memory_data.get('last_seen_targets', {})
-            ai_state.memory.last_seen_times = memory_data.get('last_seen_times', {})
+            # Copy so the new state doesn't share containers with whatever
+            # AI state last published this component's memory
+            ai_state.memory.last_seen_targets = dict(memory_data.get('last_seen_targets', {}))
+            ai_state.memory.last_seen_times = dict(memory_data.get('last_seen_times', {}))
             ai_state.memory.current_target = memory_data.get('current_target')
             ai_state.memory.current_goal = memory_data.get('current_goal')
-            ai_state.memory.goal_data = memory_data.get('goal_data', {})
-            ai_state.memory.blackboard = memory_data.get('blackboard', {})
+            ai_state.memory.goal_data = dict(memory_data.get('goal_data', {}))
+            ai_state.memory.blackboard = dict(memory_data.get('blackboard', {}))
         
         # Load current goal
         ai_state.memory.current_goal = ai_component.get('current_goal')
@@ -679,5 +1041,5 @@ class AISystem:
             # Try to load AI from component
             ai_state = self._load_ai_from_component(entity)
             if ai_state:
-                self.entity_ai_states[entity_id] = ai_state
+                self._set_ai_state(entity_id, ai_state)
                 print(f"Auto-assigned AI to entity {entity_id} based on component")
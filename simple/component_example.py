@@ -5,32 +5,31 @@ Example demonstrating the new JSON-based component system.
 Shows how to use predefined components and create custom ones.
 """
 
-import sys
-import os
-
-# Add the current directory to the path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from collections import Counter
+from itertools import chain
 
 from entities.entity import (
     Entity, EntityFactory, 
+    component_registry,
     get_available_components, 
     get_component_info,
     create_component,
     register_component,
     create_basic_templates
 )
-from generator import SimpleMapGenerator
-from data_manager import DataManager
 
 
 def main():
+    # Imported here so importing this module only loads the entity system
+    from generator import SimpleMapGenerator
+    from data_manager import DataManager
+    
     print("Solar Factions - JSON Component System Example")
     print("=" * 50)
     
     # 1. Show available components
     print("\n1. Available Components:")
-    components = get_available_components()
-    for comp in sorted(components):
+    for comp in component_registry.sorted_names:
         info = get_component_info(comp)
         print(f"   • {comp}: {info['description']}")
     
@@ -45,7 +44,7 @@ def main():
     fighter.add_component('ai', intelligence_level=85, aggression_level=0.8)
     
     print(f"   Created: {fighter}")
-    print(f"   Components: {list(fighter.components.keys())}")
+    print(f"   Components: {', '.join(fighter.components)}")
     print(f"   Max Speed: {fighter.get_component('movement')['max_speed']}")
     print(f"   Weapon Type: {fighter.get_component('combat')['weapon_type']}")
     
@@ -57,7 +56,7 @@ def main():
     research_ship.add_component('exploration', exploration_range=300.0, survey_equipment=['advanced_scanner', 'spectrometer'])
     
     print(f"\n   Created: {research_ship}")
-    print(f"   Components: {list(research_ship.components.keys())}")
+    print(f"   Components: {', '.join(research_ship.components)}")
     print(f"   Research Focus: {research_ship.get_component('research')['research_focus']}")
     print(f"   Sensor Range: {research_ship.get_component('communication')['sensor_range']}")
     
@@ -114,7 +113,7 @@ def main():
     
     warp_ship = factory.create_entity('warp_capable_ship', (700, 600), name='Enterprise')
     print(f"   Created from template: {warp_ship}")
-    print(f"   Components: {list(warp_ship.components.keys())}")
+    print(f"   Components: {', '.join(warp_ship.components)}")
     
     # 5. Generate a map with the enhanced system
     print(f"\n5. Map Generation with Enhanced Components:")
@@ -125,10 +124,7 @@ def main():
     print(f"   Generated {len(entities)} entities")
     
     # Show component usage statistics
-    component_stats = {}
-    for entity in entities:
-        for comp_name in entity.components.keys():
-            component_stats[comp_name] = component_stats.get(comp_name, 0) + 1
+    component_stats = Counter(chain.from_iterable(entity.components for entity in entities))
     
     if component_stats:
         print(f"   Component usage:")
@@ -10,10 +10,23 @@ import os
 import sys
 from typing import Dict, Any, List
 
-# Add the current directory to the path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from entities.entity import component_registry, get_component_info
 
-from entities.entity import component_registry, get_available_components, get_component_info
+# Property types accepted in component definitions; 'position' is only
+# used by the core components and isn't offered when creating new ones
+CREATABLE_PROPERTY_TYPES = ('integer', 'float', 'string', 'boolean', 'array', 'object')
+VALID_PROPERTY_TYPES = frozenset(CREATABLE_PROPERTY_TYPES + ('position',))
+
+# Parse a default value typed at the prompt, by property type
+_TRUTHY = frozenset(('true', '1', 'yes', 'on'))
+_DEFAULT_PARSERS = {
+    'integer': int,
+    'float': float,
+    'boolean': lambda value: value.lower() in _TRUTHY,
+    'array': json.loads,
+    'object': json.loads,
+    'string': str,
+}
 
 
 def list_components():
@@ -21,8 +34,8 @@ def list_components():
     print("Available Components:")
     print("=" * 50)
     
-    components = get_available_components()
-    for component_name in sorted(components):
+    components = component_registry.sorted_names
+    for component_name in components:
         info = get_component_info(component_name)
         print(f"• {component_name}: {info['description']}")
     
@@ -79,7 +92,7 @@ def create_component_template():
             break
         
         prop_type = input(f"Type for {prop_name} (integer/float/string/boolean/array/object): ").strip()
-        if prop_type not in ['integer', 'float', 'string', 'boolean', 'array', 'object']:
+        if prop_type not in CREATABLE_PROPERTY_TYPES:
             prop_type = 'string'
         
         prop_description = input(f"Description for {prop_name}: ").strip()
@@ -96,19 +109,7 @@ def create_component_template():
         if default_value:
             # Try to parse the default value
             try:
-                if prop_type == 'integer':
-                    default_value = int(default_value)
-                elif prop_type == 'float':
-                    default_value = float(default_value)
-                elif prop_type == 'boolean':
-                    default_value = default_value.lower() in ['true', '1', 'yes', 'on']
-                elif prop_type == 'array':
-                    default_value = json.loads(default_value)
-                elif prop_type == 'object':
-                    default_value = json.loads(default_value)
-                # string stays as string
-                
-                prop_def["default"] = default_value
+                prop_def["default"] = _DEFAULT_PARSERS[prop_type](default_value)
             except (ValueError, json.JSONDecodeError):
                 print(f"Warning: Could not parse default value '{default_value}', skipping")
         
@@ -118,20 +119,24 @@ def create_component_template():
     custom_components_path = os.path.join('data', 'components', 'custom_components.json')
     
     try:
+        os.makedirs(os.path.dirname(custom_components_path), exist_ok=True)
+        
         # Load existing custom components
-        if os.path.exists(custom_components_path):
+        try:
             with open(custom_components_path, 'r') as f:
                 custom_components = json.load(f)
-        else:
+        except FileNotFoundError:
             custom_components = {}
         
         # Add new component
         custom_components[name] = component_def
         
-        # Save back
-        os.makedirs(os.path.dirname(custom_components_path), exist_ok=True)
-        with open(custom_components_path, 'w') as f:
+        # Save back through a temporary file so a failed write can't
+        # truncate the existing custom components
+        temp_path = custom_components_path + '.tmp'
+        with open(temp_path, 'w') as f:
             json.dump(custom_components, f, indent=2)
+        os.replace(temp_path, custom_components_path)
         
         print(f"\nComponent '{name}' saved to {custom_components_path}")
         
@@ -181,7 +186,7 @@ def validate_component_file(filepath: str):
                         print(f"  Warning: Property {prop_name} has no type")
                     else:
                         prop_type = prop_def['type']
-                        if prop_type not in ['integer', 'float', 'string', 'boolean', 'array', 'object', 'position']:
+                        if prop_type not in VALID_PROPERTY_TYPES:
                             print(f"  Warning: Property {prop_name} has unknown type: {prop_type}")
             
             print(f"  ✓ Component {component_name} is valid")
@@ -1,54 +1,59 @@
 # config.py - Configuration for the simplified system
 """
 Configuration settings for the simplified Solar Factions system.
+
+Settings are read-only: sequences are tuples and mappings are
+MappingProxyType views, so importers can't mutate shared settings.
 """
 
+from types import MappingProxyType
+
 # Default map generation settings
 DEFAULT_MAP_SIZE = (1000, 1000)
 DEFAULT_ENTITY_COUNT = 50
 DEFAULT_SEED = None
 
 # Entity generation bounds
-ENTITY_BOUNDS = {
-    'star': {'min_count': 1, 'max_count': 3},
-    'planet': {'min_count': 2, 'max_count': 8},
-    'asteroid': {'min_count': 5, 'max_count': 20},
-    'space_station': {'min_count': 1, 'max_count': 5},
-    'cargo_ship': {'min_count': 3, 'max_count': 10},
-    'fighter': {'min_count': 1, 'max_count': 8},
-    'mining_ship': {'min_count': 1, 'max_count': 5}
-}
+ENTITY_BOUNDS = MappingProxyType({
+    'star': MappingProxyType({'min_count': 1, 'max_count': 3}),
+    'planet': MappingProxyType({'min_count': 2, 'max_count': 8}),
+    'asteroid': MappingProxyType({'min_count': 5, 'max_count': 20}),
+    'space_station': MappingProxyType({'min_count': 1, 'max_count': 5}),
+    'cargo_ship': MappingProxyType({'min_count': 3, 'max_count': 10}),
+    'fighter': MappingProxyType({'min_count': 1, 'max_count': 8}),
+    'mining_ship': MappingProxyType({'min_count': 1, 'max_count': 5})
+})
 
 # Renderer settings
-RENDERER_SETTINGS = {
+RENDERER_SETTINGS = MappingProxyType({
     'width': 1200,
     'height': 800,
     'fps': 60,
     'background_color': (10, 10, 30),
     'grid_color': (30, 30, 50),
     'grid_size': 50
-}
+})
 
 # Data storage settings
-DATA_PATHS = {
+DATA_PATHS = MappingProxyType({
     'saves': 'data/saved_maps',
     'templates': 'data/templates',
     'generated': 'data/generated_maps',
     'backups': 'data/backups'
-}
+})
 
 # File extensions
-FILE_EXTENSIONS = {
+FILE_EXTENSIONS = MappingProxyType({
     'map': '.json',
     'template': '.json',
     'backup': '.json'
-}
+})
 
 # Template names
-AVAILABLE_TEMPLATES = ['basic', 'frontier', 'warzone', 'trading_hub', 'mining_sector']
+AVAILABLE_TEMPLATES = ('basic', 'frontier', 'warzone', 'trading_hub', 'mining_sector')
 
 # Entity colors for rendering
-ENTITY_COLORS = {
+ENTITY_COLORS = MappingProxyType({
     'star': (255, 255, 100),      # Yellow
     'planet': (100, 200, 100),    # Green
     'asteroid': (150, 150, 150),  # Gray
@@ -57,10 +62,10 @@ ENTITY_COLORS = {
     'fighter': (255, 100, 100),        # Red
     'mining_ship': (150, 100, 200),    # Purple
     'default': (255, 255, 255)         # White
-}
+})
 
 # Entity sizes for rendering
-ENTITY_SIZES = {
+ENTITY_SIZES = MappingProxyType({
     'star': 20,
     'planet': 15,
     'asteroid': 8,
@@ -69,4 +74,4 @@ ENTITY_SIZES = {
     'fighter': 4,
     'mining_ship': 7,
     'default': 5
-}
+})
@@ -67,8 +67,16 @@ class DataManager:
         except IOError as e:
             print(f"Error saving template {template_name}: {e}")
     
-    def save_entities(self, entities: List[Entity], filename: str, backup: bool = True):
-        """Save entities to file with optional backup"""
+    def save_entities(self, entities: List[Entity], filename: str, backup: bool = True,
+                      indent: Optional[int] = 2):
+        """
+        Save entities to file with optional backup.
+        
+        The map is encoded in one json.dumps call and written at once;
+        json.dump streams through the pure-Python encoder whatever the
+        indent. Pass indent=None for a compact file, which dumps encodes
+        in C several times faster.
+        """
         filepath = os.path.join(self.generated_dir, f"{filename}.json")
         
         # Create backup if requested and file exists
@@ -87,7 +95,7 @@ class DataManager:
         
         try:
             with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+                f.write(json.dumps(data, indent=indent))
         except IOError as e:
             print(f"Error saving entities to {filename}: {e}")
             raise
@@ -282,7 +290,7 @@ class DataManager:
             stats['entity_types'][entity_type] = stats['entity_types'].get(entity_type, 0) + 1
             
             # Track components
-            for component_name in entity.components.keys():
+            for component_name in entity.components:
                 stats['components_used'].add(component_name)
         
         # Convert set to list for JSON serialization
@@ -3,13 +3,14 @@
 Demonstration of AI-Component Integration in Solar Factions
 """
 
-from ai_system import AISystem
 from entities.entity import Entity, create_component
-from game_manager import GameManager
+import threading
 import time
 
 def demo_ai_component_integration():
     """Demonstrate AI-Component integration features"""
+    # Imported here so importing this module doesn't load the game stack
+    from game_manager import GameManager
     
     print("🚀 Solar Factions AI-Component Integration Demo")
     print("=" * 60)
@@ -70,17 +71,23 @@ def demo_ai_component_integration():
     game_manager.entities = entities
     game_manager._assign_behaviors_to_entities()
     
+    # The entity set is fixed from here on and AI states and components
+    # are updated in place, so look each of them up once
+    ai_entities = [(entity.properties.get('name', entity.type),
+                    game_manager.ai_system.get_ai_state(entity.id),
+                    entity.get_component('ai'))
+                   for entity in entities]
+    
     print("✓ AI system configured")
     
     print("\n3. Demonstrating auto-assignment...")
     
     # Show AI states
-    for entity in entities:
-        ai_state = game_manager.ai_system.get_ai_state(entity.id)
+    for name, ai_state, _ in ai_entities:
         if ai_state:
-            print(f"  - {entity.properties.get('name', entity.type)}: {ai_state.behavior_name} (Energy: {ai_state.energy:.1f})")
+            print(f"  - {name}: {ai_state.behavior_name} (Energy: {ai_state.energy:.1f})")
         else:
-            print(f"  - {entity.properties.get('name', entity.type)}: No AI assigned")
+            print(f"  - {name}: No AI assigned")
     
     print("\n4. Running simulation to show component synchronization...")
     
@@ -89,33 +96,37 @@ def demo_ai_component_integration():
     
     print("✓ Game loop started")
     
-    # Run for a few seconds
+    # Run for a few seconds, waking once per second (and at the deadline)
+    # to report
     simulation_time = 3.0
-    start_time = time.time()
-    
-    while time.time() - start_time < simulation_time:
-        time.sleep(0.1)
+    start_time = time.monotonic()
+    deadline = start_time + simulation_time
+    wake = threading.Event()
+    now = start_time
+    
+    while True:
+        wake.wait(min(1.0, deadline - now))
+        now = time.monotonic()
         
         # Check AI states periodically
-        if int((time.time() - start_time) * 10) % 10 == 0:
-            print(f"\n--- At {time.time() - start_time:.1f}s ---")
-            for entity in entities:
-                ai_state = game_manager.ai_system.get_ai_state(entity.id)
-                ai_comp = entity.get_component('ai')
-                if ai_state and ai_comp:
-                    memory_keys = len(ai_comp.get('memory', {}))
-                    print(f"  {entity.properties.get('name', entity.type)}: "
-                          f"{ai_state.behavior_name} | Energy: {ai_state.energy:.1f} | "
-                          f"Memory: {memory_keys} items")
+        print(f"\n--- At {now - start_time:.1f}s ---")
+        for name, ai_state, ai_comp in ai_entities:
+            if ai_state and ai_comp:
+                memory_keys = len(ai_comp.get('memory', {}))
+                print(f"  {name}: "
+                      f"{ai_state.behavior_name} | Energy: {ai_state.energy:.1f} | "
+                      f"Memory: {memory_keys} items")
+        
+        if now >= deadline:
+            break
     
     print("\n5. Demonstrating component persistence...")
     
     # Show that AI data is persisted in components
-    for entity in entities:
-        ai_comp = entity.get_component('ai')
+    for name, _, ai_comp in ai_entities:
         if ai_comp:
             memory = ai_comp.get('memory', {})
-            print(f"  {entity.properties.get('name', entity.type)}: "
+            print(f"  {name}: "
                   f"Goal: {ai_comp.get('current_goal', 'None')} | "
                   f"Memory items: {len(memory)}")
     
@@ -141,10 +152,9 @@ def demo_ai_component_integration():
     print("\n7. Final component state...")
     
     # Show final state of all AI components
-    for entity in entities:
-        ai_comp = entity.get_component('ai')
+    for name, _, ai_comp in ai_entities:
         if ai_comp:
-            print(f"  {entity.properties.get('name', entity.type)}:")
+            print(f"  {name}:")
             print(f"    Type: {ai_comp['ai_type']}")
             print(f"    Goal: {ai_comp.get('current_goal', 'None')}")
             print(f"    Aggression: {ai_comp['aggression_level']:.1f}")
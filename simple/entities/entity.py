@@ -5,19 +5,51 @@ This replaces the complex hierarchy with a flexible component-based approach.
 Components are now configurable and extendable through JSON files.
 """
 
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional, TYPE_CHECKING, Mapping
+from types import MappingProxyType
 import json
-import uuid
+import time
 import os
-from datetime import datetime
+import sys
+
+# datetime is only needed when timestamps are read or (de)serialized, so it
+# is imported there; tools that just list components never load it
+if TYPE_CHECKING:
+    from datetime import datetime
+
+
+# Python types accepted for each property type named in a component definition
+_PROPERTY_TYPE_CHECKS = {
+    'integer': int,
+    'float': (int, float),
+    'string': str,
+    'boolean': bool,
+    'array': list,
+    'object': dict,
+}
 
 
 class ComponentRegistry:
     """Registry for managing component definitions from JSON files"""
     
+    __slots__ = ('components', 'component_paths', '_version', '_names_cache',
+                 '_sorted_names_cache', '_info_cache', '_defaults', '_property_types')
+    
     def __init__(self):
         self.components = {}
         self.component_paths = []
+        
+        # Bumped on every registration; cached listings are rebuilt after a bump
+        self._version = 0
+        self._names_cache: Optional[Tuple[str, ...]] = None
+        self._sorted_names_cache: Optional[Tuple[str, ...]] = None
+        self._info_cache: Dict[str, MappingProxyType] = {}
+        
+        # Default values per component, resolved once at registration
+        self._defaults: Dict[str, Dict[str, Any]] = {}
+        # Python types to check per typed property, used by validate_component_data
+        self._property_types: Dict[str, Dict[str, Any]] = {}
+        
         self._load_default_components()
     
     def _load_default_components(self):
@@ -53,7 +85,28 @@ class ComponentRegistry:
     
     def register_component(self, name: str, definition: Dict[str, Any]):
         """Register a component definition"""
+        # Interned so lookups with literal names compare by identity
+        name = sys.intern(name)
         self.components[name] = definition
+        if definition:
+            properties = definition.get('properties', {})
+            self._defaults[name] = {
+                prop_name: prop_def['default'] if isinstance(prop_def, dict) and 'default' in prop_def else prop_def
+                for prop_name, prop_def in properties.items()
+            }
+            self._property_types[name] = {
+                prop_name: _PROPERTY_TYPE_CHECKS[prop_def['type']]
+                for prop_name, prop_def in properties.items()
+                if isinstance(prop_def, dict) and isinstance(prop_def.get('type'), str)
+                and prop_def['type'] in _PROPERTY_TYPE_CHECKS
+            }
+        else:
+            self._defaults.pop(name, None)
+            self._property_types.pop(name, None)
+        self._version += 1
+        self._names_cache = None
+        self._sorted_names_cache = None
+        self._info_cache.clear()
     
     def get_component_definition(self, name: str) -> Optional[Dict[str, Any]]:
         """Get a component definition by name"""
@@ -61,29 +114,63 @@ class ComponentRegistry:
     
     def create_component(self, name: str, **overrides) -> Dict[str, Any]:
         """Create a component instance with default values and overrides"""
-        definition = self.get_component_definition(name)
-        if not definition:
+        return self.create_component_from_dict(name, overrides)
+    
+    def create_component_from_dict(self, name: str, overrides: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a component instance from an overrides dict, without a kwargs round trip"""
+        defaults = self._defaults.get(name)
+        if defaults is None:
             # Return a basic component if definition not found
-            return overrides
+            return dict(overrides)
         
-        # Start with default values from the definition
-        component_data = {}
-        properties = definition.get('properties', {})
-        
-        for prop_name, prop_def in properties.items():
-            if isinstance(prop_def, dict) and 'default' in prop_def:
-                component_data[prop_name] = prop_def['default']
-            else:
-                component_data[prop_name] = prop_def
-        
-        # Apply overrides
-        component_data.update(overrides)
+        # Start with default values from the definition, then apply overrides
+        component_data = defaults.copy()
+        if overrides:
+            component_data.update(overrides)
         
         return component_data
     
-    def get_available_components(self) -> List[str]:
-        """Get list of all available component names"""
-        return list(self.components.keys())
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever a component definition is registered"""
+        return self._version
+    
+    def get_available_components(self) -> Tuple[str, ...]:
+        """Get all available component names"""
+        names = self._names_cache
+        if names is None:
+            names = self._names_cache = tuple(self.components)
+        return names
+    
+    @property
+    def sorted_names(self) -> Tuple[str, ...]:
+        """All available component names in sorted order"""
+        names = self._sorted_names_cache
+        if names is None:
+            names = self._sorted_names_cache = tuple(sorted(self.components))
+        return names
+    
+    def get_component_info(self, name: str) -> MappingProxyType:
+        """Get read-only detailed information about a component"""
+        info = self._info_cache.get(name)
+        if info is None:
+            definition = self.get_component_definition(name)
+            if definition:
+                info = {
+                    'name': name,
+                    'description': definition.get('description', 'No description'),
+                    'properties': definition.get('properties', {}),
+                    'available': True
+                }
+            else:
+                info = {
+                    'name': name,
+                    'description': 'Unknown component',
+                    'properties': {},
+                    'available': False
+                }
+            info = self._info_cache[name] = MappingProxyType(info)
+        return info
     
     def get_component_description(self, name: str) -> str:
         """Get description of a component"""
@@ -94,30 +181,15 @@ class ComponentRegistry:
     
     def validate_component_data(self, name: str, data: Dict[str, Any]) -> bool:
         """Validate component data against its definition"""
-        definition = self.get_component_definition(name)
-        if not definition:
+        property_types = self._property_types.get(name)
+        if property_types is None:
             return True  # Allow unknown components
         
-        properties = definition.get('properties', {})
-        
+        # Basic type validation against the types resolved at registration
         for prop_name, prop_value in data.items():
-            if prop_name in properties:
-                prop_def = properties[prop_name]
-                if isinstance(prop_def, dict) and 'type' in prop_def:
-                    expected_type = prop_def['type']
-                    # Basic type validation
-                    if expected_type == 'integer' and not isinstance(prop_value, int):
-                        return False
-                    elif expected_type == 'float' and not isinstance(prop_value, (int, float)):
-                        return False
-                    elif expected_type == 'string' and not isinstance(prop_value, str):
-                        return False
-                    elif expected_type == 'boolean' and not isinstance(prop_value, bool):
-                        return False
-                    elif expected_type == 'array' and not isinstance(prop_value, list):
-                        return False
-                    elif expected_type == 'object' and not isinstance(prop_value, dict):
-                        return False
+            expected_type = property_types.get(prop_name)
+            if expected_type is not None and not isinstance(prop_value, expected_type):
+                return False
         
         return True
 
@@ -126,6 +198,23 @@ class ComponentRegistry:
 component_registry = ComponentRegistry()
 
 
+_urandom = os.urandom
+
+
+def _new_entity_id() -> str:
+    """Random version-4 UUID string, same format as str(uuid.uuid4())"""
+    # Formatting the random int directly skips building a UUID object
+    n = int.from_bytes(_urandom(16), 'big')
+    n = (n & ~(0xf000 << 64) & ~(0xc000 << 48)) | (0x4000 << 64) | (0x8000 << 48)
+    h = '%032x' % n
+    return f'{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}'
+
+
+# Shared result for get_component misses; read-only so writes to a missing
+# component fail loudly instead of being silently dropped
+_EMPTY_COMPONENT = MappingProxyType({})
+
+
 class Entity:
     """
     Simplified entity with component system.
@@ -137,34 +226,69 @@ class Entity:
     - Components: Modular behaviors (movement, combat, trading, etc.)
     """
     
+    # Maps hold many entities; slots drop the per-instance __dict__
+    __slots__ = ('id', 'type', 'position', 'properties', 'components',
+                 '_created_ts', '_updated_ts')
+    
     def __init__(self, entity_type: str, position: Tuple[float, float], **properties):
-        self.id = str(uuid.uuid4())
+        self.id = _new_entity_id()
         self.type = entity_type
         self.position = position
         self.properties = properties
         self.components = {}
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        # Timestamps are kept as time.time() floats; datetime objects are
+        # only built when created_at/updated_at are read
+        self._created_ts = self._updated_ts = time.time()
+    
+    def _reinit(self, position: Tuple[float, float], properties: Dict[str, Any]):
+        """Reset a released entity in place so EntityFactory can reuse it"""
+        self.id = _new_entity_id()
+        self.position = position
+        self.properties.update(properties)
+        self._created_ts = self._updated_ts = time.time()
+    
+    @property
+    def created_at(self) -> 'datetime':
+        from datetime import datetime
+        return datetime.fromtimestamp(self._created_ts)
+    
+    @created_at.setter
+    def created_at(self, value: 'datetime'):
+        self._created_ts = value.timestamp()
+    
+    @property
+    def updated_at(self) -> 'datetime':
+        from datetime import datetime
+        return datetime.fromtimestamp(self._updated_ts)
+    
+    @updated_at.setter
+    def updated_at(self, value: 'datetime'):
+        self._updated_ts = value.timestamp()
     
     def add_component(self, name: str, component_data: Dict[str, Any] = None, **kwargs):
         """Add a component to this entity"""
-        if component_data is None:
-            component_data = {}
-        
-        # Merge component_data with kwargs
-        component_data.update(kwargs)
+        # Keyword overrides win over component_data; the caller's dict is
+        # left untouched and only merged when both are given
+        if kwargs:
+            component_data = {**component_data, **kwargs} if component_data else kwargs
         
         # Use the component registry to create the component with proper defaults
-        self.components[name] = component_registry.create_component(name, **component_data)
-        self.updated_at = datetime.now()
+        self.components[name] = component_registry.create_component_from_dict(
+            name, component_data or _EMPTY_COMPONENT)
+        self._updated_ts = time.time()
     
     def add_component_from_template(self, name: str, **overrides):
         """Add a component using the registry template with optional overrides"""
         self.add_component(name, **overrides)
     
-    def get_component(self, name: str) -> Dict[str, Any]:
-        """Get a component from this entity"""
-        return self.components.get(name, {})
+    def get_component(self, name: str) -> Mapping[str, Any]:
+        """
+        Get a component from this entity.
+        
+        A missing component returns a shared empty mapping that is
+        read-only; add the component with add_component() before writing.
+        """
+        return self.components.get(name, _EMPTY_COMPONENT)
     
     def has_component(self, name: str) -> bool:
         """Check if entity has a specific component"""
@@ -174,7 +298,7 @@ class Entity:
         """Remove a component from this entity"""
         if name in self.components:
             del self.components[name]
-            self.updated_at = datetime.now()
+            self._updated_ts = time.time()
     
     def get_property(self, name: str, default=None):
         """Get a property value"""
@@ -183,36 +307,54 @@ class Entity:
     def set_property(self, name: str, value: Any):
         """Set a property value"""
         self.properties[name] = value
-        self.updated_at = datetime.now()
+        self._updated_ts = time.time()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert entity to dictionary for serialization"""
+        from datetime import datetime
+        
+        # Timestamp formatting dominates this method; entities that were
+        # never modified after creation share a single string
+        created_at = datetime.fromtimestamp(self._created_ts).isoformat()
+        if self._updated_ts == self._created_ts:
+            updated_at = created_at
+        else:
+            updated_at = datetime.fromtimestamp(self._updated_ts).isoformat()
+        
         return {
             'id': self.id,
             'type': self.type,
             'position': self.position,
             'properties': self.properties,
             'components': self.components,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': created_at,
+            'updated_at': updated_at
         }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Entity':
         """Create entity from dictionary"""
-        entity = cls(
-            entity_type=data['type'],
-            position=tuple(data['position']),
-            **data.get('properties', {})
-        )
-        entity.id = data.get('id', entity.id)
-        entity.components = data.get('components', {})
+        # Fill the slots directly rather than going through __init__, which
+        # would generate an id and timestamps only to overwrite them
+        entity = cls.__new__(cls)
+        # Strings parsed from JSON are fresh objects; interning the type and
+        # component names lets later lookups against the registry's interned
+        # names match by identity
+        entity.type = sys.intern(data['type'])
+        entity.position = tuple(data['position'])
+        entity.properties = dict(data.get('properties', ()))
+        entity.components = {sys.intern(name): component
+                             for name, component in data.get('components', {}).items()}
+        
+        entity.id = data['id'] if 'id' in data else _new_entity_id()
         
         # Parse timestamps if present
-        if 'created_at' in data:
-            entity.created_at = datetime.fromisoformat(data['created_at'])
-        if 'updated_at' in data:
-            entity.updated_at = datetime.fromisoformat(data['updated_at'])
+        from datetime import datetime
+        created_at = data.get('created_at')
+        updated_at = data.get('updated_at')
+        now = time.time() if created_at is None or updated_at is None else None
+        entity._created_ts = now if created_at is None else datetime.fromisoformat(created_at).timestamp()
+        entity._updated_ts = now if updated_at is None else datetime.fromisoformat(updated_at).timestamp()
         
         return entity
     
@@ -225,37 +367,85 @@ class Entity:
 
 
 class EntityFactory:
-    """Factory for creating entities from templates"""
+    """
+    Factory for creating entities from templates.
+    
+    Entities handed back through release() are kept in a per-type pool and
+    reused by the next create_entity() call for that type. A released
+    entity is reset in place, so callers must not keep using it.
+    """
+    
+    __slots__ = ('templates', '_builds', '_resolved', '_pools')
+    
+    # Upper bound on released entities kept per entity type
+    MAX_POOLED_PER_TYPE = 1024
     
     def __init__(self):
         self.templates = {}
+        # Per template: (properties, ((component_name, overrides), ...)),
+        # resolved at registration so create_entity doesn't re-inspect it
+        self._builds: Dict[str, Tuple[Dict[str, Any], Tuple[Tuple[str, Dict[str, Any]], ...]]] = {}
+        # Per template: (registry version, ((component_name, component), ...))
+        # with defaults already merged in; rebuilt when the registry changes
+        self._resolved: Dict[str, Tuple[int, Tuple[Tuple[str, Dict[str, Any]], ...]]] = {}
+        self._pools: Dict[str, List[Entity]] = {}
     
     def register_template(self, entity_type: str, template: Dict[str, Any]):
         """Register a template for creating entities of a specific type"""
+        entity_type = sys.intern(entity_type)
         self.templates[entity_type] = template
+        
+        # A dict config is used as override data; a string or other value
+        # just names the component
+        components = tuple(
+            (sys.intern(component_name), component_config if isinstance(component_config, dict) else {})
+            for component_name, component_config in template.get('components', {}).items())
+        properties = {sys.intern(key): value for key, value in template.get('properties', {}).items()}
+        self._builds[entity_type] = (properties, components)
+        self._resolved.pop(entity_type, None)
+    
+    def _resolved_components(self, entity_type: str,
+                             components: Tuple[Tuple[str, Dict[str, Any]], ...]) -> Tuple[Tuple[str, Dict[str, Any]], ...]:
+        """Template components merged with registry defaults, cached per registry version"""
+        version = component_registry.version
+        cached = self._resolved.get(entity_type)
+        if cached is None or cached[0] != version:
+            cached = self._resolved[entity_type] = (version, tuple(
+                (component_name, component_registry.create_component_from_dict(component_name, component_config))
+                for component_name, component_config in components))
+        return cached[1]
     
     def create_entity(self, entity_type: str, position: Tuple[float, float], **overrides) -> Entity:
         """Create an entity from a template"""
-        template = self.templates.get(entity_type, {})
+        properties, components = self._builds.get(entity_type, ({}, ()))
         
-        # Merge template properties with overrides
-        properties = template.get('properties', {}).copy()
-        properties.update(overrides)
+        # Merge template properties with overrides, reusing a released
+        # entity of this type when one is available
+        pool = self._pools.get(entity_type)
+        if pool:
+            entity = pool.pop()
+            entity._reinit(position, {**properties, **overrides})
+        else:
+            entity = Entity(entity_type, position, **{**properties, **overrides})
         
-        # Create entity
-        entity = Entity(entity_type, position, **properties)
-        
-        # Add template components
-        for component_name, component_config in template.get('components', {}).items():
-            if isinstance(component_config, dict):
-                # If it's a dictionary, use it as override data
-                entity.add_component(component_name, **component_config)
-            else:
-                # If it's a string or other type, treat it as a component name
-                entity.add_component(component_name)
+        # Add template components; each entity gets its own copy
+        if components:
+            entity_components = entity.components
+            for component_name, component in self._resolved_components(entity_type, components):
+                entity_components[component_name] = component.copy()
         
         return entity
     
+    def release(self, entity: Entity):
+        """Return a destroyed entity to the pool for reuse by create_entity"""
+        pool = self._pools.setdefault(entity.type, [])
+        # A second release of the same entity would hand it out twice
+        if len(pool) >= self.MAX_POOLED_PER_TYPE or any(e is entity for e in pool):
+            return
+        entity.components.clear()
+        entity.properties.clear()
+        pool.append(entity)
+    
     def load_templates(self, filepath: str):
         """Load entity templates from JSON file"""
         with open(filepath, 'r') as f:
@@ -266,27 +456,14 @@ class EntityFactory:
 
 
 # Component management functions
-def get_available_components() -> List[str]:
-    """Get list of all available component names"""
+def get_available_components() -> Tuple[str, ...]:
+    """Get all available component names"""
     return component_registry.get_available_components()
 
 
-def get_component_info(name: str) -> Dict[str, Any]:
+def get_component_info(name: str) -> MappingProxyType:
     """Get detailed information about a component"""
-    definition = component_registry.get_component_definition(name)
-    if definition:
-        return {
-            'name': name,
-            'description': definition.get('description', 'No description'),
-            'properties': definition.get('properties', {}),
-            'available': True
-        }
-    return {
-        'name': name,
-        'description': 'Unknown component',
-        'properties': {},
-        'available': False
-    }
+    return component_registry.get_component_info(name)
 
 
 def create_component(name: str, **overrides) -> Dict[str, Any]:
@@ -304,6 +481,18 @@ def register_component(name: str, definition: Dict[str, Any]):
     component_registry.register_component(name, definition)
 
 
+class _ComponentDefaults:
+    """Descriptor returning a copy of a component's defaults on class or instance access"""
+    
+    __slots__ = ('name',)
+    
+    def __init__(self, name: str):
+        self.name = name
+    
+    def __get__(self, instance, owner=None) -> Dict[str, Any]:
+        return component_registry.create_component(self.name)
+
+
 # Legacy ComponentTemplates class for backward compatibility
 class ComponentTemplates:
     """Legacy component templates - now uses the registry system"""
@@ -332,30 +521,14 @@ class ComponentTemplates:
     def get_trading(**overrides):
         return create_component('trading', **overrides)
     
-    # Legacy static properties for backward compatibility
-    @property
-    def MOVEMENT(self):
-        return create_component('movement')
-    
-    @property
-    def HEALTH(self):
-        return create_component('health')
-    
-    @property
-    def CARGO(self):
-        return create_component('cargo')
-    
-    @property
-    def COMBAT(self):
-        return create_component('combat')
-    
-    @property
-    def MINING(self):
-        return create_component('mining')
-    
-    @property
-    def TRADING(self):
-        return create_component('trading')
+    # Legacy static attributes for backward compatibility; each access
+    # returns a fresh copy of the registry defaults
+    MOVEMENT = _ComponentDefaults('movement')
+    HEALTH = _ComponentDefaults('health')
+    CARGO = _ComponentDefaults('cargo')
+    COMBAT = _ComponentDefaults('combat')
+    MINING = _ComponentDefaults('mining')
+    TRADING = _ComponentDefaults('trading')
 
 
 # Example usage and predefined entity types
@@ -478,13 +651,13 @@ if __name__ == "__main__":
     movement_info = get_component_info('movement')
     print(f"\nMovement component info:")
     print(f"  Description: {movement_info['description']}")
-    print(f"  Properties: {list(movement_info['properties'].keys())}")
+    print(f"  Properties: {', '.join(movement_info['properties'])}")
     
     # Serialize and deserialize
     ship_data = ship.to_dict()
     reconstructed_ship = Entity.from_dict(ship_data)
     print(f"\nReconstructed: {reconstructed_ship}")
-    print(f"Reconstructed ship components: {list(reconstructed_ship.components.keys())}")
+    print(f"Reconstructed ship components: {', '.join(reconstructed_ship.components)}")
     
     # Demonstrate dynamic component creation
     print(f"\nDynamic component creation:")
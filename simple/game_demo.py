@@ -92,8 +92,8 @@ def run_system_showcase():
             print(f"Active entities: {len(entities)}")
             
             # Show a few entity details
-            for i, entity_info in enumerate(entities[:3]):
-                detailed_info = game_manager.get_entity_info(entity_info['id'])
+            details = game_manager.get_entities_info_bulk([e['id'] for e in entities[:3]])
+            for i, detailed_info in enumerate(details):
                 print(f"  Entity {i+1}: {detailed_info['type']} at {detailed_info['position']}")
                 if 'ai' in detailed_info:
                     print(f"    AI: {detailed_info['ai']['behavior']} (Energy: {detailed_info['ai']['energy']:.1f})")
@@ -142,8 +142,7 @@ def run_behavior_demo():
         # Show initial behaviors
         print("\nInitial behavior assignments:")
         entities = game_manager.list_entities()
-        for entity_info in entities:
-            detailed_info = game_manager.get_entity_info(entity_info['id'])
+        for detailed_info in game_manager.get_entities_info_bulk([e['id'] for e in entities]):
             entity_type = detailed_info['type']
             ai_behavior = detailed_info.get('ai', {}).get('behavior', 'none')
             print(f"  {entity_type}: {ai_behavior}")
@@ -156,16 +155,16 @@ def run_behavior_demo():
         print("\nForcing behavior changes...")
         
         # Find different types of entities
-        fighters = [e for e in entities if 'fighter' in e['type']]
-        cargo_ships = [e for e in entities if 'cargo' in e['type']]
+        fighters = game_manager.entities_by_type.get('fighter', [])
+        cargo_ships = game_manager.entities_by_type.get('cargo_ship', [])
         
         if fighters:
-            fighter_id = fighters[0]['id']
+            fighter_id = fighters[0].id
             print(f"Changing fighter to patrol behavior...")
             game_manager.ai_system.set_behavior(fighter_id, 'sector_patrol')
         
         if cargo_ships:
-            cargo_id = cargo_ships[0]['id']
+            cargo_id = cargo_ships[0].id
             print(f"Changing cargo ship to flee behavior...")
             game_manager.ai_system.set_behavior(cargo_id, 'merchant_escape')
         
@@ -175,8 +174,7 @@ def run_behavior_demo():
         
         # Show final state
         print("\nFinal behavior state:")
-        for entity_info in entities:
-            detailed_info = game_manager.get_entity_info(entity_info['id'])
+        for detailed_info in game_manager.get_entities_info_bulk([e['id'] for e in entities]):
             entity_type = detailed_info['type']
             ai_behavior = detailed_info.get('ai', {}).get('behavior', 'none')
             ai_energy = detailed_info.get('ai', {}).get('energy', 0)
@@ -6,7 +6,8 @@ Provides precise timing, speed controls, and frame-rate independent updates.
 
 import time
 import threading
-from typing import List, Callable, Optional, Dict, Any
+from collections import deque
+from typing import Callable, Optional, Dict, Any, Tuple, Deque
 from dataclasses import dataclass
 
 
@@ -27,6 +28,15 @@ class GameState:
     actual_tps: float = 0.0
 
 
+def _without(systems: Tuple[Callable[[float], None], ...],
+             system: Callable[[float], None]) -> Tuple[Callable[[float], None], ...]:
+    """Copy of systems with the first occurrence of system removed"""
+    if system not in systems:
+        return systems
+    index = systems.index(system)
+    return systems[:index] + systems[index + 1:]
+
+
 class GameLoop:
     """
     Tick-based game loop with time controls.
@@ -39,41 +49,67 @@ class GameLoop:
         # Timing
         self.tick_interval = 1.0 / target_tps
         self.frame_interval = 1.0 / target_fps
+        # Real time between ticks and game time per tick at the current
+        # speed; only set_speed() changes them
+        self._adjusted_interval = self.tick_interval
+        self._tick_dt = self.tick_interval
         self.last_tick_time = 0.0
         self.last_frame_time = 0.0
         self.start_time = 0.0
         
-        # System callbacks
-        self.update_systems: List[Callable[[float], None]] = []
-        self.render_systems: List[Callable[[float], None]] = []
+        # System callbacks. Held as tuples that are replaced, never mutated,
+        # so the loops can iterate them while systems are added or removed
+        self.update_systems: Tuple[Callable[[float], None], ...] = ()
+        self.render_systems: Tuple[Callable[[float], None], ...] = ()
+        # (system, divider) for each update system, in update_systems order
+        self._update_schedule: Tuple[Tuple[Callable[[float], None], int], ...] = ()
+        self._systems_lock = threading.Lock()
         
-        # Threading
+        # Threading; ticks and frames both run on game_thread
         self.game_thread: Optional[threading.Thread] = None
-        self.render_thread: Optional[threading.Thread] = None
+        # Set by stop(); the loop sleeps on it so shutdown wakes it at once
+        self._stop_event = threading.Event()
+        # Keeps step() calls from other threads from overlapping the loop's
+        # ticks and frames, so render systems never see half-updated state
         self.thread_lock = threading.Lock()
         
-        # Statistics tracking
-        self.tick_times: List[float] = []
-        self.frame_times: List[float] = []
+        # Statistics tracking; the deques drop their oldest sample when full
         self.max_stat_samples = 100
+        self.tick_times: Deque[float] = deque(maxlen=self.max_stat_samples)
+        self.frame_times: Deque[float] = deque(maxlen=self.max_stat_samples)
+        # Running totals of the samples above, so averages don't re-sum them
+        self._tick_time_sum = 0.0
+        self._frame_time_sum = 0.0
         
-    def add_update_system(self, system: Callable[[float], None]):
-        """Add a system that runs on game ticks"""
-        self.update_systems.append(system)
+    def add_update_system(self, system: Callable[[float], None], divider: int = 1):
+        """
+        Add a system that runs on game ticks.
+        
+        A divider above 1 runs the system only every divider-th tick, passing
+        it the game time of all the ticks since its last run.
+        """
+        divider = max(1, int(divider))
+        with self._systems_lock:
+            self.update_systems = self.update_systems + (system,)
+            self._update_schedule = self._update_schedule + ((system, divider),)
         
     def add_render_system(self, system: Callable[[float], None]):
         """Add a system that runs on render frames"""
-        self.render_systems.append(system)
+        with self._systems_lock:
+            self.render_systems = self.render_systems + (system,)
         
     def remove_update_system(self, system: Callable[[float], None]):
         """Remove an update system"""
-        if system in self.update_systems:
-            self.update_systems.remove(system)
+        with self._systems_lock:
+            if system in self.update_systems:
+                index = self.update_systems.index(system)
+                self._update_schedule = self._update_schedule[:index] + self._update_schedule[index + 1:]
+            self.update_systems = _without(self.update_systems, system)
             
     def remove_render_system(self, system: Callable[[float], None]):
         """Remove a render system"""
-        if system in self.render_systems:
-            self.render_systems.remove(system)
+        with self._systems_lock:
+            self.render_systems = _without(self.render_systems, system)
     
     def start(self):
         """Start the game loop"""
@@ -82,27 +118,23 @@ class GameLoop:
             
         self.state.is_running = True
         self.state.is_paused = False
-        self.start_time = time.time()
+        self._stop_event.clear()
+        self.start_time = time.monotonic()
         self.last_tick_time = self.start_time
         self.last_frame_time = self.start_time
         
-        # Start game thread (for game logic)
+        # Start game thread (for game logic and rendering)
         self.game_thread = threading.Thread(target=self._game_loop, daemon=True)
         self.game_thread.start()
         
-        # Start render thread (for rendering)
-        self.render_thread = threading.Thread(target=self._render_loop, daemon=True)
-        self.render_thread.start()
-        
     def stop(self):
         """Stop the game loop"""
         self.state.is_running = False
+        self._stop_event.set()
         
-        # Wait for threads to finish
+        # Wait for the thread to finish
         if self.game_thread and self.game_thread.is_alive():
             self.game_thread.join(timeout=1.0)
-        if self.render_thread and self.render_thread.is_alive():
-            self.render_thread.join(timeout=1.0)
     
     def pause(self):
         """Pause the game loop"""
@@ -115,94 +147,116 @@ class GameLoop:
     def set_speed(self, multiplier: float):
         """Set game speed multiplier (1.0 = normal speed)"""
         self.state.speed_multiplier = max(0.1, min(10.0, multiplier))
+        self._adjusted_interval = self.tick_interval / self.state.speed_multiplier
+        self._tick_dt = self.tick_interval * self.state.speed_multiplier
         
     def step(self):
         """Execute one game tick (useful for debugging)"""
         if not self.state.is_running:
             return
             
-        current_time = time.time()
-        dt = self.tick_interval * self.state.speed_multiplier
+        dt = self._tick_dt
         
         self._update_game_logic(dt)
         self.state.tick += 1
         self.state.game_time += dt
         
     def _game_loop(self):
-        """Main game logic loop (runs in separate thread)"""
-        while self.state.is_running:
-            current_time = time.time()
-            
-            if not self.state.is_paused:
-                # Calculate time since last tick
-                time_since_last_tick = current_time - self.last_tick_time
-                
-                # Check if it's time for a tick
-                adjusted_interval = self.tick_interval / self.state.speed_multiplier
-                if time_since_last_tick >= adjusted_interval:
-                    # Calculate delta time
-                    dt = self.tick_interval * self.state.speed_multiplier
-                    
-                    # Update game logic
-                    self._update_game_logic(dt)
-                    
-                    # Update state
-                    self.state.tick += 1
-                    self.state.game_time += dt
-                    self.state.real_time = current_time - self.start_time
-                    
-                    # Track performance
-                    self.tick_times.append(time_since_last_tick)
-                    if len(self.tick_times) > self.max_stat_samples:
-                        self.tick_times.pop(0)
-                    
-                    # Update TPS
-                    if self.tick_times:
-                        avg_tick_time = sum(self.tick_times) / len(self.tick_times)
-                        self.state.actual_tps = 1.0 / avg_tick_time if avg_tick_time > 0 else 0
-                    
-                    self.last_tick_time = current_time
-            
-            # Small sleep to prevent CPU spinning
-            time.sleep(0.001)
-    
-    def _render_loop(self):
-        """Main render loop (runs in separate thread)"""
-        while self.state.is_running:
-            current_time = time.time()
+        """
+        Main loop (runs in a separate thread).
+        
+        Ticks and frames share one thread: under the GIL a second thread
+        adds switching overhead without running anything in parallel. The
+        thread sleeps until whichever of the next tick or frame is due first.
+        """
+        # Monotonic, so wall clock adjustments can't stall or burst ticks
+        clock = time.monotonic
+        stop_event = self._stop_event
+        while not stop_event.is_set():
+            current_time = clock()
+            adjusted_interval = self._adjusted_interval
             
-            # Calculate time since last frame
-            time_since_last_frame = current_time - self.last_frame_time
+            if not self.state.is_paused and current_time - self.last_tick_time >= adjusted_interval:
+                self._run_tick(current_time)
+                # The tick itself took time; only then is the clock re-read
+                current_time = clock()
             
-            # Check if it's time for a frame
-            if time_since_last_frame >= self.frame_interval:
-                # Calculate delta time for rendering
-                dt = time_since_last_frame
-                
-                # Update render systems
-                self._update_render_systems(dt)
-                
-                # Track performance
-                self.frame_times.append(time_since_last_frame)
-                if len(self.frame_times) > self.max_stat_samples:
-                    self.frame_times.pop(0)
-                
-                # Update FPS
-                if self.frame_times:
-                    avg_frame_time = sum(self.frame_times) / len(self.frame_times)
-                    self.state.actual_fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0
-                
-                self.last_frame_time = current_time
+            if current_time - self.last_frame_time >= self.frame_interval:
+                self._run_frame(current_time)
+                current_time = clock()
             
-            # Small sleep to prevent CPU spinning
-            time.sleep(0.001)
+            # Sleep until the next tick or frame is due rather than polling;
+            # nothing but frames come due while paused. Waiting on the stop
+            # event lets stop() cut the sleep short
+            next_due = self.last_frame_time + self.frame_interval
+            if not self.state.is_paused:
+                next_due = min(next_due, self.last_tick_time + adjusted_interval)
+            sleep_for = next_due - current_time
+            if sleep_for > 0:
+                stop_event.wait(sleep_for)
+    
+    def _run_tick(self, current_time: float):
+        """Run one game tick and update tick statistics"""
+        time_since_last_tick = current_time - self.last_tick_time
+        
+        # Calculate delta time
+        dt = self._tick_dt
+        
+        # Update game logic
+        self._update_game_logic(dt)
+        
+        # Update state
+        self.state.tick += 1
+        self.state.game_time += dt
+        self.state.real_time = current_time - self.start_time
+        
+        # Track performance
+        tick_times = self.tick_times
+        if len(tick_times) == tick_times.maxlen:
+            self._tick_time_sum -= tick_times[0]
+        tick_times.append(time_since_last_tick)
+        self._tick_time_sum += time_since_last_tick
+        
+        # Update TPS
+        avg_tick_time = self._tick_time_sum / len(tick_times)
+        self.state.actual_tps = 1.0 / avg_tick_time if avg_tick_time > 0 else 0
+        
+        self.last_tick_time = current_time
+    
+    def _run_frame(self, current_time: float):
+        """Run one render frame and update frame statistics"""
+        # Delta time for rendering is the real time since the last frame
+        time_since_last_frame = current_time - self.last_frame_time
+        
+        # Update render systems
+        self._update_render_systems(time_since_last_frame)
+        
+        # Track performance
+        frame_times = self.frame_times
+        if len(frame_times) == frame_times.maxlen:
+            self._frame_time_sum -= frame_times[0]
+        frame_times.append(time_since_last_frame)
+        self._frame_time_sum += time_since_last_frame
+        
+        # Update FPS
+        avg_frame_time = self._frame_time_sum / len(frame_times)
+        self.state.actual_fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0
+        
+        self.last_frame_time = current_time
     
     def _update_game_logic(self, dt: float):
-        """Update all game logic systems"""
+        """Update the game logic systems due this tick"""
+        tick = self.state.tick
         with self.thread_lock:
-            for system in self.update_systems:
+            for system, divider in self._update_schedule:
+                if divider != 1:
+                    if tick % divider:
+                        continue
+                    system_dt = dt * divider
+                else:
+                    system_dt = dt
                 try:
-                    system(dt)
+                    system(system_dt)
                 except Exception as e:
                     print(f"Error in update system: {e}")
     
@@ -233,17 +287,24 @@ class GameLoop:
             'render_systems': len(self.render_systems)
         }
     
+    def format_stats(self) -> str:
+        """Current performance statistics as printable text"""
+        stats = self.get_stats()
+        return "\n".join([
+            "\n--- Game Loop Statistics ---",
+            f"Tick: {stats['tick']}",
+            f"Game Time: {stats['game_time']:.2f}s",
+            f"Real Time: {stats['real_time']:.2f}s",
+            f"Time Ratio: {stats['time_ratio']:.2f}",
+            f"Status: {'Running' if stats['is_running'] else 'Stopped'}",
+            f"Paused: {'Yes' if stats['is_paused'] else 'No'}",
+            f"Speed: {stats['speed_multiplier']:.1f}x",
+            f"TPS: {stats['actual_tps']:.1f} / {stats['target_tps']}",
+            f"FPS: {stats['actual_fps']:.1f} / {stats['target_fps']}",
+            f"Systems: {stats['update_systems']} update, {stats['render_systems']} render",
+        ])
+    
     def print_stats(self):
         """Print current performance statistics"""
-        stats = self.get_stats()
-        print(f"\n--- Game Loop Statistics ---")
-        print(f"Tick: {stats['tick']}")
-        print(f"Game Time: {stats['game_time']:.2f}s")
-        print(f"Real Time: {stats['real_time']:.2f}s")
-        print(f"Time Ratio: {stats['time_ratio']:.2f}")
-        print(f"Status: {'Running' if stats['is_running'] else 'Stopped'}")
-        print(f"Paused: {'Yes' if stats['is_paused'] else 'No'}")
-        print(f"Speed: {stats['speed_multiplier']:.1f}x")
-        print(f"TPS: {stats['actual_tps']:.1f} / {stats['target_tps']}")
-        print(f"FPS: {stats['actual_fps']:.1f} / {stats['target_fps']}")
-        print(f"Systems: {stats['update_systems']} update, {stats['render_systems']} render")
+        # One write rather than a print per line
+        print(self.format_stats())
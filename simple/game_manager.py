@@ -5,7 +5,9 @@ and rendering for Solar Factions.
 """
 
 import os
+import threading
 import time
+from collections import Counter
 from typing import List, Dict, Optional, Tuple, Any
 from entities.entity import Entity
 from data_manager import DataManager
@@ -16,12 +18,33 @@ from movement_system import MovementSystem
 from ai_system import AISystem
 
 
+# Entity type -> (movement behavior, AI behavior); None means the entity
+# gets no behavior of that kind
+TYPE_BEHAVIOR_TABLE: Dict[str, Tuple[Optional[str], Optional[str]]] = {
+    'fighter': ('fast_patrol', 'pirate_hunter'),
+    'cargo_ship': ('cargo_route', 'trade_circuit'),
+    'mining_ship': ('exploration', 'resource_hunter'),
+    # Stations don't move but have defensive AI
+    'space_station': (None, 'station_defender'),
+    # Celestial bodies don't move or have AI
+    'star': (None, None),
+    'planet': (None, None),
+}
+
+# Behaviors for entity types missing from the table
+DEFAULT_BEHAVIORS: Tuple[Optional[str], Optional[str]] = ('slow_patrol', 'default_idle')
+
+
 class GameManager:
     """
     Main game manager that coordinates all systems.
     Provides high-level interface for running the game.
     """
     
+    # AI decisions run every this many ticks (5 Hz at the default 20 TPS);
+    # movement still integrates every tick
+    AI_TICK_DIVIDER = 4
+    
     def __init__(self, data_path: str = "data"):
         self.data_path = data_path
         self.data_manager = DataManager(data_path)
@@ -35,8 +58,17 @@ class GameManager:
         
         # Game state
         self.entities: List[Entity] = []
+        # Entities grouped by type and indexed by id; rebuilt whenever
+        # behaviors are assigned
+        self.entities_by_type: Dict[str, List[Entity]] = {}
+        self._entity_by_id: Dict[str, Entity] = {}
         self.is_running = False
+        # Set when the game loop stops, so waiting callers wake at once
+        self._stopped = threading.Event()
         self.show_debug = False
+        # (text, rendered surface) per debug overlay line, reused while the
+        # text is unchanged
+        self._debug_surfaces: List[Tuple[str, Any]] = []
         self.selected_entity: Optional[Entity] = None
         
         # Configuration paths
@@ -62,6 +94,7 @@ class GameManager:
         self.ai_system.load_config(self.ai_config_path)
         
         # Register systems with game loop
+        self.game_loop.add_update_system(self._update_ai, divider=self.AI_TICK_DIVIDER)
         self.game_loop.add_update_system(self._update_game_logic)
         self.game_loop.add_render_system(self._update_rendering)
     
@@ -105,33 +138,29 @@ class GameManager:
     
     def _assign_behaviors_to_entities(self):
         """Assign appropriate behaviors to entities based on their type"""
+        entities_by_type: Dict[str, List[Entity]] = {}
+        self.entities_by_type = entities_by_type
+        self._entity_by_id = {entity.id: entity for entity in self.entities if hasattr(entity, 'id')}
+        
         for entity in self.entities:
             if not hasattr(entity, 'id') or not hasattr(entity, 'type'):
                 continue
-                
-            entity_type = entity.type
-            entity_id = entity.id
             
-            # Assign movement behaviors
-            if entity_type == 'fighter':
-                self.movement_system.assign_behavior(entity_id, 'fast_patrol')
-                self.ai_system.assign_ai_to_entity(entity, 'pirate_hunter')
-            elif entity_type == 'cargo_ship':
-                self.movement_system.assign_behavior(entity_id, 'cargo_route')
-                self.ai_system.assign_ai_to_entity(entity, 'trade_circuit')
-            elif entity_type == 'mining_ship':
-                self.movement_system.assign_behavior(entity_id, 'exploration')
-                self.ai_system.assign_ai_to_entity(entity, 'resource_hunter')
-            elif entity_type == 'space_station':
-                # Stations don't move but have defensive AI
-                self.ai_system.assign_ai_to_entity(entity, 'station_defender')
-            elif entity_type in ['star', 'planet']:
-                # Celestial bodies don't move or have AI
-                pass
+            same_type = entities_by_type.get(entity.type)
+            if same_type is None:
+                entities_by_type[entity.type] = [entity]
             else:
-                # Default behavior for other entities
-                self.movement_system.assign_behavior(entity_id, 'slow_patrol')
-                self.ai_system.assign_ai_to_entity(entity, 'default_idle')
+                same_type.append(entity)
+        
+        # One table lookup and one bulk movement assignment per type
+        for entity_type, same_type in entities_by_type.items():
+            movement_behavior, ai_behavior = TYPE_BEHAVIOR_TABLE.get(entity_type, DEFAULT_BEHAVIORS)
+            if movement_behavior:
+                self.movement_system.assign_behavior_bulk([entity.id for entity in same_type],
+                                                          movement_behavior)
+            if ai_behavior:
+                for entity in same_type:
+                    self.ai_system.assign_ai_to_entity(entity, ai_behavior)
     
     def start_rendering(self, width: int = 1200, height: int = 800):
         """Start the visual renderer"""
@@ -143,6 +172,7 @@ class GameManager:
         """Start the main game loop"""
         if not self.is_running:
             self.is_running = True
+            self._stopped.clear()
             self.game_loop.start()
             print("Game loop started")
     
@@ -150,6 +180,7 @@ class GameManager:
         """Stop the main game loop"""
         if self.is_running:
             self.is_running = False
+            self._stopped.set()
             self.game_loop.stop()
             print("Game loop stopped")
     
@@ -173,32 +204,43 @@ class GameManager:
         self.game_loop.step()
         print("Game stepped")
     
-    def _update_game_logic(self, dt: float):
-        """Update game logic (called by game loop)"""
+    def _update_ai(self, dt: float):
+        """Update AI decisions (called by game loop every AI_TICK_DIVIDER ticks)"""
         if not self.entities:
             return
         
         # Update AI system
         self.ai_system.update(self.entities, dt)
         
-        # Update movement system
-        self.movement_system.update(self.entities, dt)
-        
         # Update AI movement targets based on AI decisions
         self._sync_ai_with_movement()
     
+    def _update_game_logic(self, dt: float):
+        """Update game logic (called by game loop)"""
+        if not self.entities:
+            return
+        
+        # Update movement system
+        self.movement_system.update(self.entities, dt)
+    
     def _sync_ai_with_movement(self):
         """Synchronize AI decisions with movement system"""
+        # Straight dict lookups against both systems' tables; the same as
+        # get_ai_state() and set_target() per entity without the calls
+        ai_states = self.ai_system.entity_ai_states
+        movements = self.movement_system.entity_movements
+        
         for entity in self.entities:
-            if not hasattr(entity, 'id'):
-                continue
-                
             entity_id = entity.id
-            ai_state = self.ai_system.get_ai_state(entity_id)
+            ai_state = ai_states.get(entity_id)
+            if ai_state is None:
+                continue
             
-            if ai_state and 'target_position' in ai_state.memory.goal_data:
-                target_pos = ai_state.memory.goal_data['target_position']
-                self.movement_system.set_target(entity_id, target_pos)
+            goal_data = ai_state.memory.goal_data
+            if 'target_position' in goal_data:
+                movement_data = movements.get(entity_id)
+                if movement_data is not None:
+                    movement_data.target_position = goal_data['target_position']
     
     def _update_rendering(self, dt: float):
         """Update rendering (called by game loop)"""
@@ -231,11 +273,22 @@ class GameManager:
             f"Paused: {'Yes' if stats['is_paused'] else 'No'}"
         ]
         
-        # Render debug text
+        # Render debug text; most lines change rarely, so only re-render
+        # the ones whose text differs from the last frame
+        cache = self._debug_surfaces
+        render = self.renderer.font.render
+        blit = self.renderer.screen.blit
         y_offset = 10
-        for line in debug_lines:
-            text_surface = self.renderer.font.render(line, True, (255, 255, 255))
-            self.renderer.screen.blit(text_surface, (10, y_offset))
+        for i, line in enumerate(debug_lines):
+            if i < len(cache) and cache[i][0] == line:
+                text_surface = cache[i][1]
+            else:
+                text_surface = render(line, True, (255, 255, 255))
+                if i < len(cache):
+                    cache[i] = (line, text_surface)
+                else:
+                    cache.append((line, text_surface))
+            blit(text_surface, (10, y_offset))
             y_offset += 25
     
     def run_interactive(self):
@@ -264,35 +317,47 @@ class GameManager:
         print("  Mouse wheel - Zoom")
         print("  Click entity - Select")
         
+        # Event constants and the loop state, looked up once rather than
+        # per event; GameState is mutated in place, so the binding stays live
+        QUIT, KEYDOWN = pygame.QUIT, pygame.KEYDOWN
+        K_ESCAPE, K_SPACE, K_s, K_d = pygame.K_ESCAPE, pygame.K_SPACE, pygame.K_s, pygame.K_d
+        SPEED_UP_KEYS = (pygame.K_PLUS, pygame.K_EQUALS)
+        K_MINUS = pygame.K_MINUS
+        get_events = pygame.event.get
+        handle_event = renderer.handle_event
+        state = self.game_loop.state
+        
         try:
             while running:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
+                for event in get_events():
+                    event_type = event.type
+                    if event_type == QUIT:
                         running = False
                     
-                    elif event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_ESCAPE:
+                    elif event_type == KEYDOWN:
+                        key = event.key
+                        if key == K_ESCAPE:
                             running = False
-                        elif event.key == pygame.K_SPACE:
-                            if self.game_loop.state.is_paused:
+                        elif key == K_SPACE:
+                            if state.is_paused:
                                 self.resume_game()
                             else:
                                 self.pause_game()
-                        elif event.key == pygame.K_PLUS or event.key == pygame.K_EQUALS:
-                            new_speed = min(10.0, self.game_loop.state.speed_multiplier * 1.5)
+                        elif key in SPEED_UP_KEYS:
+                            new_speed = min(10.0, state.speed_multiplier * 1.5)
                             self.set_game_speed(new_speed)
-                        elif event.key == pygame.K_MINUS:
-                            new_speed = max(0.1, self.game_loop.state.speed_multiplier / 1.5)
+                        elif key == K_MINUS:
+                            new_speed = max(0.1, state.speed_multiplier / 1.5)
                             self.set_game_speed(new_speed)
-                        elif event.key == pygame.K_s:
-                            if self.game_loop.state.is_paused:
+                        elif key == K_s:
+                            if state.is_paused:
                                 self.step_game()
-                        elif event.key == pygame.K_d:
+                        elif key == K_d:
                             self.show_debug = not self.show_debug
                             print(f"Debug info: {'ON' if self.show_debug else 'OFF'}")
                     
                     # Handle renderer events
-                    renderer.handle_event(event)
+                    handle_event(event)
                 
                 # Limit frame rate for event handling
                 clock.tick(60)
@@ -311,17 +376,21 @@ class GameManager:
         # Start game loop
         self.start_game_loop()
         
-        start_time = time.time()
-        last_stats_time = start_time
+        deadline = time.monotonic() + duration
+        next_stats_time = time.monotonic() + 2.0
         
         try:
-            while time.time() - start_time < duration:
+            # Sleep until the next statistics print or the end of the run,
+            # waking early if the game loop is stopped
+            while not self._stopped.wait(max(0.0, min(next_stats_time, deadline) - time.monotonic())):
+                now = time.monotonic()
+                if now >= deadline:
+                    break
+                
                 # Print statistics every few seconds
-                if time.time() - last_stats_time >= 2.0:
+                if now >= next_stats_time:
                     self.game_loop.print_stats()
-                    last_stats_time = time.time()
-                
-                time.sleep(0.1)
+                    next_stats_time = now + 2.0
                 
         except KeyboardInterrupt:
             print("\nSimulation interrupted")
@@ -332,20 +401,27 @@ class GameManager:
     
     def get_entity_info(self, entity_id: str) -> Dict[str, Any]:
         """Get detailed information about an entity"""
-        entity = None
-        for e in self.entities:
-            if hasattr(e, 'id') and e.id == entity_id:
-                entity = e
-                break
-        
+        entity = self._entity_by_id.get(entity_id)
         if not entity:
             return {"error": "Entity not found"}
         
+        return self._entity_info(entity)
+    
+    def get_entities_info_bulk(self, entity_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get detailed information about several entities in one pass"""
+        by_id = self._entity_by_id
+        return [self._entity_info(by_id[entity_id]) if entity_id in by_id
+                else {"error": "Entity not found"}
+                for entity_id in entity_ids]
+    
+    def _entity_info(self, entity) -> Dict[str, Any]:
+        """Detailed information about an entity"""
+        entity_id = entity.id
         info = {
             "id": entity.id,
             "type": entity.type,
             "position": getattr(entity, 'position', (0, 0)),
-            "components": list(entity.components.keys()) if hasattr(entity, 'components') else []
+            "components": list(entity.components) if hasattr(entity, 'components') else []
         }
         
         # Add AI information
@@ -386,42 +462,36 @@ class GameManager:
     
     def print_statistics(self):
         """Print comprehensive game statistics"""
-        print("\n=== Game Statistics ===")
+        # Collected and printed in one write rather than a print per line
+        lines = ["\n=== Game Statistics ==="]
         
         # Game loop stats
-        self.game_loop.print_stats()
+        lines.append(self.game_loop.format_stats())
         
-        # Entity counts
-        entity_counts = {}
+        # Entity and AI behavior counts, gathered in one pass
+        entity_counts = Counter()
+        ai_behavior_counts = Counter()
+        get_ai_state = self.ai_system.entity_ai_states.get
         for entity in self.entities:
-            entity_type = entity.type
-            entity_counts[entity_type] = entity_counts.get(entity_type, 0) + 1
+            entity_counts[entity.type] += 1
+            ai_state = get_ai_state(getattr(entity, 'id', None))
+            if ai_state:
+                ai_behavior_counts[ai_state.behavior_name] += 1
         
-        print(f"\n--- Entity Counts ---")
-        for entity_type, count in sorted(entity_counts.items()):
-            print(f"{entity_type}: {count}")
+        # Movement stats
+        movement_behavior_counts = Counter(self.movement_system.entity_behaviors.values())
         
-        # AI stats
-        ai_behavior_counts = {}
-        for entity in self.entities:
-            if hasattr(entity, 'id'):
-                ai_state = self.ai_system.get_ai_state(entity.id)
-                if ai_state:
-                    behavior = ai_state.behavior_name
-                    ai_behavior_counts[behavior] = ai_behavior_counts.get(behavior, 0) + 1
+        lines.append("\n--- Entity Counts ---")
+        for entity_type, count in sorted(entity_counts.items()):
+            lines.append(f"{entity_type}: {count}")
         
-        print(f"\n--- AI Behavior Counts ---")
+        lines.append("\n--- AI Behavior Counts ---")
         for behavior, count in sorted(ai_behavior_counts.items()):
-            print(f"{behavior}: {count}")
-        
-        # Movement stats
-        movement_behavior_counts = {}
-        for entity_id in self.movement_system.entity_behaviors:
-            behavior = self.movement_system.entity_behaviors[entity_id]
-            movement_behavior_counts[behavior] = movement_behavior_counts.get(behavior, 0) + 1
+            lines.append(f"{behavior}: {count}")
         
-        print(f"\n--- Movement Behavior Counts ---")
+        lines.append("\n--- Movement Behavior Counts ---")
         for behavior, count in sorted(movement_behavior_counts.items()):
-            print(f"{behavior}: {count}")
+            lines.append(f"{behavior}: {count}")
         
-        print(f"\nTotal Systems: {len(self.game_loop.update_systems)} update, {len(self.game_loop.render_systems)} render")
+        lines.append(f"\nTotal Systems: {len(self.game_loop.update_systems)} update, {len(self.game_loop.render_systems)} render")
+        print("\n".join(lines))
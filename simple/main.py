@@ -261,7 +261,7 @@ def print_map_info(entities: List[Entity], generator: SimpleMapGenerator,
         for entity in entities:
             print(f"  {entity}")
             if entity.components:
-                print(f"    Components: {list(entity.components.keys())}")
+                print(f"    Components: {', '.join(entity.components)}")
 
 
 def render_map(entities: List[Entity]):
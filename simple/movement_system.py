@@ -47,8 +47,13 @@ class MovementBehavior:
 class LinearMovement(MovementBehavior):
     """Simple linear movement with velocity"""
     
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        # Config values are read once here rather than on every update
+        self.max_speed = config.get('max_speed', 50.0)
+    
     def _update_movement(self, entity: Entity, dt: float, movement_data: MovementData) -> None:
-        max_speed = self.config.get('max_speed', 50.0)
+        max_speed = self.max_speed
         
         # Apply acceleration
         acc_x, acc_y = movement_data.acceleration
@@ -57,104 +62,111 @@ class LinearMovement(MovementBehavior):
         vel_x += acc_x * dt
         vel_y += acc_y * dt
         
-        # Limit speed
-        speed = math.sqrt(vel_x * vel_x + vel_y * vel_y)
-        if speed > max_speed:
+        # Limit speed; the square root is only needed when clamping
+        speed_sq = vel_x * vel_x + vel_y * vel_y
+        if speed_sq > max_speed * max_speed:
+            speed = math.sqrt(speed_sq)
             vel_x = (vel_x / speed) * max_speed
             vel_y = (vel_y / speed) * max_speed
         
         movement_data.velocity = (vel_x, vel_y)
         
         # Update position
-        if hasattr(entity, 'position'):
-            x, y = entity.position
-            x += vel_x * dt
-            y += vel_y * dt
-            entity.position = (x, y)
+        position = getattr(entity, 'position', None)
+        if position is not None:
+            x, y = position
+            entity.position = (x + vel_x * dt, y + vel_y * dt)
 
 
 class CircularMovement(MovementBehavior):
     """Circular movement around a center point"""
     
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.center = config.get('center', (0.0, 0.0))
+        self.radius = config.get('radius', 100.0)
+        self.angular_speed = config.get('angular_speed', 1.0)
+    
     def _update_movement(self, entity: Entity, dt: float, movement_data: MovementData) -> None:
-        center = self.config.get('center', (0.0, 0.0))
-        radius = self.config.get('radius', 100.0)
-        angular_speed = self.config.get('angular_speed', 1.0)
-        
         # Update rotation
-        movement_data.rotation += angular_speed * dt
+        rotation = movement_data.rotation + self.angular_speed * dt
+        movement_data.rotation = rotation
         
         # Calculate new position
         if hasattr(entity, 'position'):
-            x = center[0] + radius * math.cos(movement_data.rotation)
-            y = center[1] + radius * math.sin(movement_data.rotation)
-            entity.position = (x, y)
+            center = self.center
+            radius = self.radius
+            entity.position = (center[0] + radius * math.cos(rotation),
+                               center[1] + radius * math.sin(rotation))
 
 
 class OrbitMovement(MovementBehavior):
     """Orbit around another entity"""
     
-    def _update_movement(self, entity: Entity, dt: float, movement_data: MovementData) -> None:
-        target_id = self.config.get('target_entity_id')
-        if not target_id:
-            return
-            
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.target_id = config.get('target_entity_id')
         # Find target entity (would need access to entity manager)
         # For now, use center from config
-        center = self.config.get('fallback_center', (0.0, 0.0))
-        radius = self.config.get('radius', 100.0)
-        angular_speed = self.config.get('angular_speed', 0.5)
+        self.center = config.get('fallback_center', (0.0, 0.0))
+        self.radius = config.get('radius', 100.0)
+        self.angular_speed = config.get('angular_speed', 0.5)
+    
+    def _update_movement(self, entity: Entity, dt: float, movement_data: MovementData) -> None:
+        if not self.target_id:
+            return
         
         # Update rotation
-        movement_data.rotation += angular_speed * dt
+        rotation = movement_data.rotation + self.angular_speed * dt
+        movement_data.rotation = rotation
         
         # Calculate new position
         if hasattr(entity, 'position'):
-            x = center[0] + radius * math.cos(movement_data.rotation)
-            y = center[1] + radius * math.sin(movement_data.rotation)
-            entity.position = (x, y)
+            center = self.center
+            radius = self.radius
+            entity.position = (center[0] + radius * math.cos(rotation),
+                               center[1] + radius * math.sin(rotation))
 
 
 class PatrolMovement(MovementBehavior):
     """Patrol between waypoints"""
     
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.waypoints = config.get('waypoints', [])
+        self.speed = config.get('speed', 30.0)
+        self.tolerance = config.get('arrival_tolerance', 5.0)
+    
     def _update_movement(self, entity: Entity, dt: float, movement_data: MovementData) -> None:
-        waypoints = self.config.get('waypoints', [])
-        if not waypoints:
+        if not self.waypoints:
             return
-            
-        speed = self.config.get('speed', 30.0)
-        tolerance = self.config.get('arrival_tolerance', 5.0)
         
         # Initialize path if needed
-        if not movement_data.path_points:
-            movement_data.path_points = waypoints.copy()
+        path_points = movement_data.path_points
+        if not path_points:
+            path_points = movement_data.path_points = self.waypoints.copy()
             movement_data.current_path_index = 0
         
-        if not movement_data.path_points:
+        position = getattr(entity, 'position', None)
+        if position is None:
             return
-            
+        
         # Get current target
-        target = movement_data.path_points[movement_data.current_path_index]
+        target_x, target_y = path_points[movement_data.current_path_index]
+        x, y = position
         
-        if hasattr(entity, 'position'):
-            x, y = entity.position
-            target_x, target_y = target
-            
-            # Calculate direction to target
-            dx = target_x - x
-            dy = target_y - y
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            if distance < tolerance:
-                # Reached waypoint, move to next
-                movement_data.current_path_index = (movement_data.current_path_index + 1) % len(movement_data.path_points)
-            else:
-                # Move towards target
-                if distance > 0:
-                    move_x = (dx / distance) * speed * dt
-                    move_y = (dy / distance) * speed * dt
-                    entity.position = (x + move_x, y + move_y)
+        # Calculate direction to target
+        dx = target_x - x
+        dy = target_y - y
+        distance = math.sqrt(dx * dx + dy * dy)
+        
+        if distance < self.tolerance:
+            # Reached waypoint, move to next
+            movement_data.current_path_index = (movement_data.current_path_index + 1) % len(path_points)
+        elif distance > 0:
+            # Move towards target; one division, then multiplies
+            step = self.speed * dt / distance
+            entity.position = (x + dx * step, y + dy * step)
 
 
 class WanderMovement(MovementBehavior):
@@ -162,77 +174,86 @@ class WanderMovement(MovementBehavior):
     
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
+        self.speed = config.get('speed', 20.0)
+        self.direction_change_interval = config.get('direction_change_interval', 2.0)
+        self.max_direction_change = config.get('max_direction_change', math.pi / 4)
         self.next_direction_change = 0.0
         self.current_direction = random.uniform(0, 2 * math.pi)
     
     def _update_movement(self, entity: Entity, dt: float, movement_data: MovementData) -> None:
-        speed = self.config.get('speed', 20.0)
-        direction_change_interval = self.config.get('direction_change_interval', 2.0)
-        max_direction_change = self.config.get('max_direction_change', math.pi / 4)
-        
         # Update direction change timer
         self.next_direction_change -= dt
         
         if self.next_direction_change <= 0:
             # Change direction
-            direction_change = random.uniform(-max_direction_change, max_direction_change)
-            self.current_direction += direction_change
-            self.next_direction_change = direction_change_interval
+            max_direction_change = self.max_direction_change
+            self.current_direction += random.uniform(-max_direction_change, max_direction_change)
+            self.next_direction_change = self.direction_change_interval
         
         # Move in current direction
-        if hasattr(entity, 'position'):
-            x, y = entity.position
-            move_x = math.cos(self.current_direction) * speed * dt
-            move_y = math.sin(self.current_direction) * speed * dt
-            entity.position = (x + move_x, y + move_y)
+        position = getattr(entity, 'position', None)
+        if position is not None:
+            x, y = position
+            step = self.speed * dt
+            direction = self.current_direction
+            entity.position = (x + math.cos(direction) * step, y + math.sin(direction) * step)
 
 
 class SeekMovement(MovementBehavior):
     """Seek towards a target position"""
     
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.target_position = config.get('target_position')
+        self.speed = config.get('speed', 40.0)
+        self.max_force = config.get('max_force', 100.0)
+    
     def _update_movement(self, entity: Entity, dt: float, movement_data: MovementData) -> None:
-        target = self.config.get('target_position') or movement_data.target_position
+        target = self.target_position or movement_data.target_position
         if not target:
             return
-            
-        speed = self.config.get('speed', 40.0)
-        max_force = self.config.get('max_force', 100.0)
         
-        if hasattr(entity, 'position'):
-            x, y = entity.position
-            target_x, target_y = target
+        position = getattr(entity, 'position', None)
+        if position is None:
+            return
+        
+        x, y = position
+        target_x, target_y = target
+        
+        # Calculate desired velocity
+        dx = target_x - x
+        dy = target_y - y
+        distance = math.sqrt(dx * dx + dy * dy)
+        
+        if distance > 0:
+            # Normalize and scale to desired speed
+            scale = self.speed / distance
+            desired_vel_x = dx * scale
+            desired_vel_y = dy * scale
             
-            # Calculate desired velocity
-            dx = target_x - x
-            dy = target_y - y
-            distance = math.sqrt(dx * dx + dy * dy)
+            # Calculate steering force
+            vel_x, vel_y = movement_data.velocity
+            steer_x = desired_vel_x - vel_x
+            steer_y = desired_vel_y - vel_y
             
-            if distance > 0:
-                # Normalize and scale to desired speed
-                desired_vel_x = (dx / distance) * speed
-                desired_vel_y = (dy / distance) * speed
-                
-                # Calculate steering force
-                vel_x, vel_y = movement_data.velocity
-                steer_x = desired_vel_x - vel_x
-                steer_y = desired_vel_y - vel_y
-                
-                # Limit steering force
-                steer_force = math.sqrt(steer_x * steer_x + steer_y * steer_y)
-                if steer_force > max_force:
-                    steer_x = (steer_x / steer_force) * max_force
-                    steer_y = (steer_y / steer_force) * max_force
-                
-                # Apply steering force as acceleration
-                movement_data.acceleration = (steer_x, steer_y)
-                
-                # Update velocity
-                vel_x += steer_x * dt
-                vel_y += steer_y * dt
-                movement_data.velocity = (vel_x, vel_y)
-                
-                # Update position
-                entity.position = (x + vel_x * dt, y + vel_y * dt)
+            # Limit steering force; the square root is only needed when clamping
+            max_force = self.max_force
+            steer_sq = steer_x * steer_x + steer_y * steer_y
+            if steer_sq > max_force * max_force:
+                steer_force = math.sqrt(steer_sq)
+                steer_x = (steer_x / steer_force) * max_force
+                steer_y = (steer_y / steer_force) * max_force
+            
+            # Apply steering force as acceleration
+            movement_data.acceleration = (steer_x, steer_y)
+            
+            # Update velocity
+            vel_x += steer_x * dt
+            vel_y += steer_y * dt
+            movement_data.velocity = (vel_x, vel_y)
+            
+            # Update position
+            entity.position = (x + vel_x * dt, y + vel_y * dt)
 
 
 class MovementSystem:
@@ -289,20 +310,34 @@ class MovementSystem:
         self.entity_behaviors[entity_id] = behavior_name
         self.entity_movements[entity_id] = MovementData(**kwargs)
     
+    def assign_behavior_bulk(self, entity_ids: List[str], behavior_name: str):
+        """Assign the same movement behavior to several entities"""
+        if behavior_name not in self.behaviors:
+            print(f"Unknown movement behavior: {behavior_name}")
+            return
+        
+        self.entity_behaviors.update(dict.fromkeys(entity_ids, behavior_name))
+        self.entity_movements.update((entity_id, MovementData()) for entity_id in entity_ids)
+    
     def update(self, entities: List[Entity], dt: float):
         """Update movement for all entities"""
+        # Locals and single get() lookups keep the per-entity cost low on
+        # maps where most entities have no movement assigned
+        behaviors = self.behaviors
+        entity_behaviors = self.entity_behaviors
+        entity_movements = self.entity_movements
+        
         for entity in entities:
-            if not hasattr(entity, 'id'):
+            entity_id = getattr(entity, 'id', None)
+            behavior_name = entity_behaviors.get(entity_id)
+            if behavior_name is None:
                 continue
-                
-            entity_id = entity.id
-            if entity_id in self.entity_behaviors:
-                behavior_name = self.entity_behaviors[entity_id]
-                if behavior_name in self.behaviors:
-                    behavior = self.behaviors[behavior_name]
-                    movement_data = self.entity_movements.get(entity_id)
-                    if movement_data:
-                        behavior.update(entity, dt, movement_data)
+            
+            behavior = behaviors.get(behavior_name)
+            if behavior is not None:
+                movement_data = entity_movements.get(entity_id)
+                if movement_data:
+                    behavior.update(entity, dt, movement_data)
     
     def set_target(self, entity_id: str, target: Tuple[float, float]):
         """Set target position for an entity"""
@@ -56,6 +56,25 @@ class TestGameLoop(unittest.TestCase):
         self.assertEqual(len(self.game_loop.update_systems), 0)
         self.assertEqual(len(self.game_loop.render_systems), 0)
     
+    def test_update_system_divider(self):
+        """Test that a divided system runs every Nth tick with the combined dt"""
+        every_tick = []
+        every_fourth = []
+        self.game_loop.add_update_system(every_tick.append)
+        self.game_loop.add_update_system(every_fourth.append, divider=4)
+        
+        self.game_loop.state.is_running = True
+        for _ in range(8):
+            self.game_loop.step()
+        self.game_loop.state.is_running = False
+        
+        self.assertEqual(len(every_tick), 8)
+        self.assertEqual(len(every_fourth), 2)
+        self.assertAlmostEqual(every_fourth[0], 4 * every_tick[0])
+        
+        self.game_loop.remove_update_system(every_fourth.append)
+        self.assertEqual(len(self.game_loop.update_systems), 1)
+    
     def test_speed_control(self):
         """Test speed control functionality"""
         # Test normal speed setting
@@ -164,6 +183,19 @@ class TestMovementSystem(unittest.TestCase):
         self.assertIn(self.test_entity.id, self.movement_system.entity_behaviors)
         self.assertIn(self.test_entity.id, self.movement_system.entity_movements)
     
+    def test_bulk_behavior_assignment(self):
+        """Test assigning one behavior to several entities at once"""
+        behavior = LinearMovement({'name': 'test_behavior', 'enabled': True})
+        self.movement_system.add_behavior('test_behavior', behavior)
+        
+        entity_ids = ['a', 'b', 'c']
+        self.movement_system.assign_behavior_bulk(entity_ids, 'test_behavior')
+        
+        for entity_id in entity_ids:
+            self.assertEqual(self.movement_system.entity_behaviors[entity_id], 'test_behavior')
+        movements = [self.movement_system.entity_movements[entity_id] for entity_id in entity_ids]
+        self.assertEqual(len(set(map(id, movements))), len(entity_ids))
+    
     def test_config_loading(self):
         """Test loading configuration from file"""
         # Create temporary config file
@@ -250,6 +282,91 @@ class TestAISystem(unittest.TestCase):
         # Check that energy increased (idle behavior should recover energy)
         self.assertGreater(ai_state.energy, initial_energy)
     
+    def test_ai_state_swap_between_updates(self):
+        """Test that removing one AI and assigning another is seen by the next update"""
+        from ai_system import IdleBehavior
+        self.ai_system.add_behavior('test_idle', IdleBehavior(
+            {'name': 'test_idle', 'enabled': True, 'energy_recovery_rate': 10.0}))
+        other_entity = Entity("test_type", (10.0, 0.0), name="other_entity")
+        entities = [self.test_entity, other_entity]
+        
+        self.ai_system.assign_ai(self.test_entity.id, 'test_idle', energy=50.0)
+        self.ai_system.update(entities, 0.1)
+        
+        self.ai_system.remove_ai(self.test_entity.id)
+        self.ai_system.assign_ai(other_entity.id, 'test_idle', energy=50.0)
+        other_state = self.ai_system.get_ai_state(other_entity.id)
+        self.ai_system.update(entities, 0.1)
+        
+        self.assertIsNone(self.ai_system.get_ai_state(self.test_entity.id))
+        self.assertGreater(other_state.energy, 50.0)
+    
+    def test_behavior_without_work_costs_no_energy(self):
+        """Test that behaviors returning early are not charged energy"""
+        from ai_system import PatrolBehavior, TradeBehavior
+        self.ai_system.add_behavior('empty_patrol', PatrolBehavior(
+            {'name': 'empty_patrol', 'waypoints': [], 'energy_cost': 10.0}))
+        self.ai_system.assign_ai(self.test_entity.id, 'empty_patrol', energy=50.0)
+        
+        for _ in range(10):
+            self.ai_system.update(self.test_entities, 0.1)
+        self.assertEqual(self.ai_system.get_ai_state(self.test_entity.id).energy, 50.0)
+        
+        # A trade run that has finished its route only advances to the next one
+        trade = TradeBehavior({'name': 'trade', 'trade_routes': [[(0.0, 0.0)]], 'energy_cost': 10.0})
+        ai_state = AIState(behavior_name='trade', energy=50.0)
+        ai_state.memory.goal_data['current_point'] = 1
+        self.assertFalse(trade.execute(self.test_entity, ai_state, self.test_entities, 0.1))
+        self.assertTrue(trade.execute(self.test_entity, ai_state, self.test_entities, 0.1))
+    
+    def test_component_memory_is_a_copy(self):
+        """Test that the AI component holds copies of the live memory containers"""
+        from ai_system import IdleBehavior
+        self.ai_system.add_behavior('test_idle', IdleBehavior({'name': 'test_idle', 'enabled': True}))
+        self.ai_system.assign_ai_to_entity(self.test_entity, 'test_idle')
+        ai_state = self.ai_system.get_ai_state(self.test_entity.id)
+        ai_state.memory.last_seen_times['target'] = 1.0
+        
+        self.ai_system.update(self.test_entities, 0.1)
+        
+        saved_memory = self.test_entity.to_dict()['components']['ai']['memory']
+        self.assertEqual(saved_memory['last_seen_times'], {'target': 1.0})
+        self.assertIsNot(saved_memory['last_seen_times'], ai_state.memory.last_seen_times)
+        self.assertIsNot(saved_memory['goal_data'], ai_state.memory.goal_data)
+    
+    def test_resighted_target_survives_eviction(self):
+        """Test that target memory forgets the least recently seen target"""
+        from ai_kernels import remember_target
+        last_seen_targets, last_seen_times = {}, {}
+        remember_target(last_seen_targets, last_seen_times, 'a', (0, 0), 1.0, 2)
+        remember_target(last_seen_targets, last_seen_times, 'b', (1, 1), 2.0, 2)
+        remember_target(last_seen_targets, last_seen_times, 'a', (2, 2), 3.0, 2)
+        remember_target(last_seen_targets, last_seen_times, 'c', (3, 3), 4.0, 2)
+        
+        self.assertEqual(last_seen_times, {'a': 3.0, 'c': 4.0})
+        self.assertEqual(last_seen_targets, {'a': (2, 2), 'c': (3, 3)})
+    
+    def test_alertness_independent_of_ai_tick_divider(self):
+        """Test that component-driven alertness changes per game second, not per AI update"""
+        from ai_system import IdleBehavior
+        
+        def alertness_after_ticks(divider):
+            ai_system = AISystem()
+            ai_system.add_behavior('test_idle', IdleBehavior({'name': 'test_idle', 'enabled': True}))
+            entity = Entity("test_type", (0.0, 0.0), name="timid")
+            ai_system.assign_ai_to_entity(entity, 'test_idle', alertness=100.0, aggression_level=0.1)
+            
+            game_loop = GameLoop(target_tps=20)
+            game_loop.add_update_system(lambda dt: ai_system.update([entity], dt), divider=divider)
+            game_loop.state.is_running = True
+            for _ in range(4):
+                game_loop.step()
+            return ai_system.get_ai_state(entity.id).alertness
+        
+        every_tick = alertness_after_ticks(1)
+        self.assertLess(every_tick, 100.0)
+        self.assertAlmostEqual(alertness_after_ticks(4), every_tick)
+    
     def test_behavior_priority(self):
         """Test behavior priority system"""
         from ai_system import IdleBehavior
@@ -271,6 +388,46 @@ class TestAISystem(unittest.TestCase):
         # The behavior should switch to the higher priority one
         self.assertEqual(ai_state.behavior_name, 'high')
     
+    def test_hunt_targets_closest_entity(self):
+        """Test that hunting picks the closest entity of a target type"""
+        from ai_system import HuntBehavior
+        
+        hunt = HuntBehavior({'name': 'hunt', 'detection_range': 100.0,
+                             'target_types': ['cargo_ship']})
+        far = Entity('cargo_ship', (60.0, 0.0))
+        near = Entity('cargo_ship', (20.0, 0.0))
+        decoy = Entity('planet', (5.0, 0.0))
+        out_of_range = Entity('cargo_ship', (150.0, 0.0))
+        entities = [self.test_entity, far, near, decoy, out_of_range]
+        
+        ai_state = AIState(behavior_name='hunt')
+        hunt.execute(self.test_entity, ai_state, entities, 0.1)
+        
+        self.assertEqual(ai_state.memory.current_target, near.id)
+        self.assertEqual(ai_state.memory.goal_data['target_position'], near.position)
+    
+    def test_spatial_grid_matches_linear_scan(self):
+        """Test that grid-backed queries agree with a full scan"""
+        import random
+        from ai_system import SpatialCache, intern_type
+        
+        rng = random.Random(7)
+        entities = [Entity(rng.choice(['fighter', 'cargo_ship', 'planet']),
+                           (rng.uniform(-500, 500), rng.uniform(-500, 500)))
+                    for _ in range(300)]
+        grid = SpatialCache(entities)
+        scan = SpatialCache(entities)
+        scan.GRID_MIN_ENTITIES = len(entities) + 1
+        wanted = frozenset([intern_type('fighter'), intern_type('cargo_ship')])
+        
+        for _ in range(200):
+            x, y = rng.uniform(-600, 600), rng.uniform(-600, 600)
+            radius = rng.choice([25.0, 80.0, 200.0])
+            self.assertEqual(grid.nearest(x, y, radius, wanted),
+                             scan.nearest(x, y, radius, wanted))
+            self.assertEqual(grid.first_within(x, y, radius),
+                             scan.first_within(x, y, radius))
+    
     def test_config_loading(self):
         """Test loading AI configuration from file"""
         config_data = {
@@ -367,6 +524,28 @@ class TestGameManager(unittest.TestCase):
             self.assertIn('type', entity_info)
             self.assertIn('position', entity_info)
     
+    def test_entities_info_bulk(self):
+        """Test bulk entity information retrieval"""
+        self.game_manager.generate_map("basic", seed=42)
+        
+        entity_ids = [info['id'] for info in self.game_manager.list_entities()]
+        bulk_info = self.game_manager.get_entities_info_bulk(entity_ids + ['missing'])
+        
+        self.assertEqual(len(bulk_info), len(entity_ids) + 1)
+        for entity_id, info in zip(entity_ids, bulk_info):
+            self.assertEqual(info, self.game_manager.get_entity_info(entity_id))
+        self.assertIn('error', bulk_info[-1])
+    
+    def test_entities_by_type(self):
+        """Test that entities are grouped by type when a map is generated"""
+        self.game_manager.generate_map("frontier", seed=42)
+        
+        grouped = self.game_manager.entities_by_type
+        self.assertEqual(sum(len(group) for group in grouped.values()),
+                         len(self.game_manager.entities))
+        for entity_type, group in grouped.items():
+            self.assertTrue(all(entity.type == entity_type for entity in group))
+    
     def test_behavior_assignment(self):
         """Test that behaviors are properly assigned to entities"""
         # Generate a map
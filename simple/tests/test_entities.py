@@ -136,6 +136,33 @@ class TestEntityFactory(unittest.TestCase):
         self.assertEqual(entity.get_property('test_prop'), 'test_value')
         self.assertTrue(entity.has_component('test_component'))
         self.assertEqual(entity.get_component('test_component')['test_data'], 123)
+    
+    def test_released_entity_is_reused(self):
+        """Test that released entities are reset and reused"""
+        ship = self.factory.create_entity('fighter', (0, 0), name='Old Ship', bounty=10)
+        old_id = ship.id
+        ship.add_component('cargo')
+        self.factory.release(ship)
+        
+        reused = self.factory.create_entity('fighter', (5, 5), name='New Ship')
+        self.assertIs(reused, ship)
+        self.assertNotEqual(reused.id, old_id)
+        self.assertEqual(reused.position, (5, 5))
+        self.assertEqual(reused.get_property('name'), 'New Ship')
+        self.assertIsNone(reused.get_property('bounty'))
+        self.assertFalse(reused.has_component('cargo'))
+        self.assertTrue(reused.has_component('combat'))
+        
+        # Releasing the same entity twice must not pool it twice
+        self.factory.release(reused)
+        self.factory.release(reused)
+        first = self.factory.create_entity('fighter', (0, 0))
+        second = self.factory.create_entity('fighter', (0, 0))
+        self.assertIsNot(first, second)
+        
+        # Other types still get fresh entities
+        star = self.factory.create_entity('star', (0, 0))
+        self.assertIsNot(star, ship)
 
 
 class TestEntityTemplates(unittest.TestCase):
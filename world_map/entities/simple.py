@@ -4,10 +4,30 @@ Simplified entity system using composition over inheritance.
 This replaces the complex hierarchy with a flexible component-based approach.
 """
 
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Mapping, TYPE_CHECKING
+from types import MappingProxyType
 import json
-import uuid
-from datetime import datetime
+import time
+import os
+
+# datetime is only needed when timestamps are read or (de)serialized, so it
+# is imported there; tools that just list components never load it
+if TYPE_CHECKING:
+    from datetime import datetime
+
+
+def _new_entity_id() -> str:
+    """Random version-4 UUID string, same format as str(uuid.uuid4())"""
+    # Formatting the random int directly skips building a UUID object
+    n = int.from_bytes(os.urandom(16), 'big')
+    n = (n & ~(0xf000 << 64) & ~(0xc000 << 48)) | (0x4000 << 64) | (0x8000 << 48)
+    h = '%032x' % n
+    return f'{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}'
+
+
+# Shared result for get_component misses; read-only so writes to a missing
+# component fail loudly instead of being silently dropped
+_EMPTY_COMPONENT = MappingProxyType({})
 
 
 class Entity:
@@ -21,23 +41,51 @@ class Entity:
     - Components: Modular behaviors (movement, combat, trading, etc.)
     """
     
+    # Maps hold many entities; slots drop the per-instance __dict__
+    __slots__ = ('id', 'type', 'position', 'properties', 'components',
+                 '_created_ts', '_updated_ts')
+    
     def __init__(self, entity_type: str, position: Tuple[float, float], **properties):
-        self.id = str(uuid.uuid4())
+        self.id = _new_entity_id()
         self.type = entity_type
         self.position = position
         self.properties = properties
         self.components = {}
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        # Timestamps are kept as time.time() floats; datetime objects are
+        # only built when created_at/updated_at are read
+        self._created_ts = self._updated_ts = time.time()
+    
+    @property
+    def created_at(self) -> 'datetime':
+        from datetime import datetime
+        return datetime.fromtimestamp(self._created_ts)
+    
+    @created_at.setter
+    def created_at(self, value: 'datetime'):
+        self._created_ts = value.timestamp()
+    
+    @property
+    def updated_at(self) -> 'datetime':
+        from datetime import datetime
+        return datetime.fromtimestamp(self._updated_ts)
+    
+    @updated_at.setter
+    def updated_at(self, value: 'datetime'):
+        self._updated_ts = value.timestamp()
     
     def add_component(self, name: str, component_data: Dict[str, Any]):
         """Add a component to this entity"""
         self.components[name] = component_data
-        self.updated_at = datetime.now()
+        self._updated_ts = time.time()
     
-    def get_component(self, name: str) -> Dict[str, Any]:
-        """Get a component from this entity"""
-        return self.components.get(name, {})
+    def get_component(self, name: str) -> Mapping[str, Any]:
+        """
+        Get a component from this entity.
+        
+        A missing component returns a shared empty mapping that is
+        read-only; add the component with add_component() before writing.
+        """
+        return self.components.get(name, _EMPTY_COMPONENT)
     
     def has_component(self, name: str) -> bool:
         """Check if entity has a specific component"""
@@ -47,7 +95,7 @@ class Entity:
         """Remove a component from this entity"""
         if name in self.components:
             del self.components[name]
-            self.updated_at = datetime.now()
+            self._updated_ts = time.time()
     
     def get_property(self, name: str, default=None):
         """Get a property value"""
@@ -56,36 +104,51 @@ class Entity:
     def set_property(self, name: str, value: Any):
         """Set a property value"""
         self.properties[name] = value
-        self.updated_at = datetime.now()
+        self._updated_ts = time.time()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert entity to dictionary for serialization"""
+        from datetime import datetime
+        
+        # Timestamp formatting dominates this method; entities that were
+        # never modified after creation share a single string
+        created_at = datetime.fromtimestamp(self._created_ts).isoformat()
+        if self._updated_ts == self._created_ts:
+            updated_at = created_at
+        else:
+            updated_at = datetime.fromtimestamp(self._updated_ts).isoformat()
+        
         return {
             'id': self.id,
             'type': self.type,
             'position': self.position,
             'properties': self.properties,
             'components': self.components,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': created_at,
+            'updated_at': updated_at
         }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Entity':
         """Create entity from dictionary"""
-        entity = cls(
-            entity_type=data['type'],
-            position=tuple(data['position']),
-            **data.get('properties', {})
-        )
-        entity.id = data.get('id', entity.id)
+        from datetime import datetime
+        
+        # Fill the slots directly rather than going through __init__, which
+        # would generate an id and timestamps only to overwrite them
+        entity = cls.__new__(cls)
+        entity.type = data['type']
+        entity.position = tuple(data['position'])
+        entity.properties = dict(data.get('properties', ()))
         entity.components = data.get('components', {})
         
+        entity.id = data['id'] if 'id' in data else _new_entity_id()
+        
         # Parse timestamps if present
-        if 'created_at' in data:
-            entity.created_at = datetime.fromisoformat(data['created_at'])
-        if 'updated_at' in data:
-            entity.updated_at = datetime.fromisoformat(data['updated_at'])
+        created_at = data.get('created_at')
+        updated_at = data.get('updated_at')
+        now = time.time() if created_at is None or updated_at is None else None
+        entity._created_ts = now if created_at is None else datetime.fromisoformat(created_at).timestamp()
+        entity._updated_ts = now if updated_at is None else datetime.fromisoformat(updated_at).timestamp()
         
         return entity
     
@@ -97,9 +160,17 @@ class Entity:
         return f"Entity(id='{self.id}', type='{self.type}', position={self.position})"
 
 
+def _fresh_component(component_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy template component data, turning tuple defaults into new lists"""
+    return {key: list(value) if isinstance(value, tuple) else value
+            for key, value in component_data.items()}
+
+
 class EntityFactory:
     """Factory for creating entities from templates"""
     
+    __slots__ = ('templates',)
+    
     def __init__(self):
         self.templates = {}
     
@@ -118,9 +189,9 @@ class EntityFactory:
         # Create entity
         entity = Entity(entity_type, position, **properties)
         
-        # Add template components
+        # Add template components; each entity gets its own copy
         for component_name, component_data in template.get('components', {}).items():
-            entity.add_component(component_name, component_data)
+            entity.add_component(component_name, _fresh_component(component_data))
         
         return entity
     
@@ -135,12 +206,17 @@ class EntityFactory:
 
 # Common component types for easy reuse
 class ComponentTemplates:
-    """Predefined component templates for common functionality"""
+    """
+    Predefined component templates for common functionality.
+    
+    Sequence defaults are tuples so the shared templates can't be mutated
+    through an entity; EntityFactory turns them into lists per entity.
+    """
     
     MOVEMENT = {
         'max_speed': 100.0,
         'acceleration': 10.0,
-        'velocity': [0.0, 0.0],
+        'velocity': (0.0, 0.0),
         'destination': None
     }
     
@@ -154,7 +230,7 @@ class ComponentTemplates:
     CARGO = {
         'capacity': 100,
         'current_load': 0,
-        'items': []
+        'items': ()
     }
     
     COMBAT = {
@@ -172,8 +248,8 @@ class ComponentTemplates:
     
     TRADING = {
         'credits': 1000,
-        'buy_orders': [],
-        'sell_orders': []
+        'buy_orders': (),
+        'sell_orders': ()
     }
 
 